@@ -4,6 +4,23 @@ Planner agent module for AEGIS project.
 Handles research planning and database selection.
 """
 
-from .planner import create_database_selection_plan, load_agent_config, get_tool_definitions, PlannerError
+from .planner import (
+    create_database_selection_plan,
+    create_database_selection_plans,
+    load_agent_config,
+    get_tool_definitions,
+    validate_selected_databases,
+    PlannerError,
+)
+from .planner_batch import submit_plans, collect_plans
 
-__all__ = ["create_database_selection_plan", "load_agent_config", "get_tool_definitions", "PlannerError"]
+__all__ = [
+    "create_database_selection_plan",
+    "create_database_selection_plans",
+    "load_agent_config",
+    "get_tool_definitions",
+    "validate_selected_databases",
+    "PlannerError",
+    "submit_plans",
+    "collect_plans",
+]
@@ -8,6 +8,8 @@ and what specific queries to run.
 
 Functions:
     create_query_plan: Creates a plan of database queries based on a research statement
+    create_database_selection_plans: Plans several research statements per LLM call
+    validate_selected_databases: Validates the model's database selection
 
 Dependencies:
     - json
@@ -15,24 +17,42 @@ Dependencies:
     - OpenAI connector for LLM calls
 """
 
+import functools
+import hashlib
 import json
 import logging
 import os
 import yaml
-from typing import Tuple, Dict, Optional, Any
+from typing import Tuple, Dict, List, Optional, Any
 
 from ...initial_setup.env_config import config
-from ...llm_connectors.rbc_openai import call_llm
+from ...llm_connectors import fast_json
+from ...llm_connectors.rbc_openai import call_llm, merge_usage_details
+from ...llm_connectors.llm_cache import create_llm_cache, make_cache_key
+from ...llm_connectors.semantic_cache import SemanticCache, embed_text
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.fiscal_statement import get_fiscal_statement
-from ...global_prompts.database_statement import get_database_statement, get_filtered_database_statement
+from ...global_prompts.database_statement import (
+    AVAILABLE_DATABASE_IDS,
+    get_database_statement,
+    get_filtered_database_statement,
+)
 from ...global_prompts.restrictions_statement import get_restrictions_statement
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
 
-# Tool name constant
+# Tool name constants
 PLANNER_TOOL_NAME = "select_databases"
+PLANNER_BATCH_TOOL_NAME = "select_databases_batch"
+
+# Forced tool choices, shared across calls
+PLANNER_TOOL_CHOICE = {"type": "function", "function": {"name": PLANNER_TOOL_NAME}}
+PLANNER_BATCH_TOOL_CHOICE = {"type": "function", "function": {"name": PLANNER_BATCH_TOOL_NAME}}
+
+# Maximum research statements marshaled into one batched planner call;
+# latency grows super-linearly beyond a handful of statements per call
+PLANNER_BATCH_SIZE = 4
 
 
 class PlannerError(Exception):
@@ -84,26 +104,117 @@ def get_tool_definitions(available_databases):
     ]
 
 
+def get_batch_tool_definitions(available_databases, plan_count):
+    """
+    Generate tool definitions for planning several research statements in one call.
+
+    Args:
+        available_databases (dict): Dictionary of available database configurations
+        plan_count (int): Number of research statements in the call; the plans
+            array must have exactly this many entries
+
+    Returns:
+        list: Batch tool definitions for the planner agent
+    """
+    databases_schema = get_tool_definitions(available_databases)[0]["function"][
+        "parameters"
+    ]["properties"]["databases"]
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": PLANNER_BATCH_TOOL_NAME,
+                "description": "Submit one database selection plan per numbered research statement.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "plans": {
+                            "type": "array",
+                            "description": "One plan for each numbered research statement.",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {
+                                        "type": "integer",
+                                        "description": "The number of the research statement this plan answers.",
+                                    },
+                                    "databases": databases_schema,
+                                },
+                                "required": ["id", "databases"],
+                            },
+                            "minItems": plan_count,
+                            "maxItems": plan_count,
+                        }
+                    },
+                    "required": ["plans"],
+                },
+            },
+        }
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _load_batch_tool_definitions(database_keys, plan_count):
+    """
+    Build and memoize the batch tool definitions per set of databases and batch size.
+
+    Args:
+        database_keys (tuple): Keys of the databases available to the user
+        plan_count (int): Number of research statements in the call
+
+    Returns:
+        list: Batch tool definitions for the planner agent
+    """
+    return get_batch_tool_definitions(dict.fromkeys(database_keys), plan_count)
+
+
 def load_agent_config(available_databases=None):
     """
     Load agent configuration from YAML file and resolve dynamic context.
     NOTE: Planner requires available_databases for filtered database_statement and dynamic tools
 
+    The static part of the configuration is built on first use and memoized per
+    set of available databases; only the dynamic context is resolved per call.
+
     Args:
         available_databases (dict): Dictionary of available database configurations
 
     Returns:
-        dict: Configuration dictionary with resolved system prompt and settings
+        dict: Configuration dictionary with resolved system prompt and settings.
+            'system_prompt' is static for a given set of databases; per-call
+            context is in 'dynamic_context'.
+    """
+    database_keys = tuple(available_databases) if available_databases is not None else None
+    static_config = _load_static_agent_config(database_keys)
+    return {**static_config, "dynamic_context": get_fiscal_statement()}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_static_agent_config(database_keys=None):
+    """
+    Build the static (cacheable) part of the agent configuration.
+
+    Args:
+        database_keys (tuple, optional): Keys of the databases available to the user
+
+    Returns:
+        dict: Configuration dictionary without the per-call dynamic context
     """
+    available_databases = dict.fromkeys(database_keys) if database_keys is not None else None
     try:
-        # Build context statements dynamically
-        context_parts = [get_project_statement(), get_fiscal_statement()]
+        # Build context statements. Only statements that are stable between calls
+        # go into the system prompt so that it forms a byte-identical prefix the
+        # provider can serve from its prompt cache; the date-dependent fiscal
+        # statement is resolved per call by load_agent_config.
+        context_parts = [get_project_statement(include_timestamp=False)]
 
         # Handle database statement - use filtered version if available_databases provided
         if available_databases is not None:
-            context_parts.append(get_filtered_database_statement(available_databases))
+            context_parts.append(
+                get_filtered_database_statement(available_databases, include_timestamp=False)
+            )
         else:
-            context_parts.append(get_database_statement())
+            context_parts.append(get_database_statement(include_timestamp=False))
 
         context_parts.append(get_restrictions_statement())
 
@@ -133,6 +244,9 @@ def load_agent_config(available_databases=None):
         if not system_prompt:
             raise PlannerError("System prompt not found in configuration")
 
+        # Identify the prompt template so response caches invalidate when it changes
+        template_version = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
         # Replace the context placeholder
         system_prompt = system_prompt.replace(
             "{{CONTEXT_START}}", f"<CONTEXT>\n{context_block}\n</CONTEXT>"
@@ -158,6 +272,7 @@ def load_agent_config(available_databases=None):
                                     "items": {
                                         "type": "string",
                                         "description": "The name of the database to query.",
+                                        "enum": list(AVAILABLE_DATABASE_IDS),
                                     },
                                     "minItems": 1,
                                     "maxItems": 5,
@@ -175,6 +290,7 @@ def load_agent_config(available_databases=None):
             "temperature": temperature,
             "system_prompt": system_prompt,
             "tool_definitions": tools,
+            "template_version": template_version,
         }
 
     except PlannerError:
@@ -184,6 +300,76 @@ def load_agent_config(available_databases=None):
         raise PlannerError("Failed to load agent configuration") from e
 
 
+def _extract_tool_arguments(response, tool_name) -> Dict[str, Any]:
+    """
+    Extract and parse the arguments of the expected tool call from an LLM response.
+
+    Args:
+        response: Chat completion response returned by call_llm
+        tool_name (str): Name of the tool the model was forced to call
+
+    Returns:
+        dict: Parsed tool call arguments
+
+    Raises:
+        PlannerError: If the response has no valid tool call for `tool_name`.
+    """
+    # Check if response object itself is valid before accessing attributes
+    choices = getattr(response, "choices", None)
+    if not choices:
+        raise PlannerError("Invalid or empty response received from LLM")
+
+    # Extract the tool call from the response
+    message = choices[0].message
+    tool_calls = message.tool_calls if message else None
+    if not tool_calls:
+        logger.warning("Expected tool call but received content instead")
+        raise PlannerError(
+            "No tool call received in response, content returned instead."
+        )
+
+    function = tool_calls[0].function
+
+    # Verify that the correct function was called
+    if function.name != tool_name:
+        raise PlannerError(f"Unexpected function call: {function.name}")
+
+    # Parse the arguments
+    try:
+        return fast_json.loads(function.arguments)
+    except json.JSONDecodeError as e:
+        raise PlannerError("Invalid JSON in tool call arguments") from e
+
+
+def validate_selected_databases(selected_databases, available_databases) -> List[str]:
+    """
+    Validate the databases selected by the model against the available databases.
+
+    Args:
+        selected_databases (list): Database names returned in the tool arguments
+        available_databases (dict): Dictionary of available database configurations
+
+    Returns:
+        list: The validated database names
+
+    Raises:
+        PlannerError: If the selection is empty or contains unknown entries.
+    """
+    if not selected_databases:
+        raise PlannerError("Missing or empty 'databases' in tool arguments")
+
+    # Validate selected databases (the tool schema already constrains the enum,
+    # so this is a single membership pass rather than per-entry branching)
+    invalid_databases = [
+        db_name
+        for db_name in selected_databases
+        if not isinstance(db_name, str) or db_name not in available_databases
+    ]
+    if invalid_databases:
+        raise PlannerError(f"Invalid databases selected: {invalid_databases}")
+    return list(selected_databases)
+
+
 # Module-level configuration variables (will be set by the functions that call the planner)
 MODEL_CAPABILITY = "small"
 MAX_TOKENS = 4096
@@ -195,6 +381,15 @@ MODEL_NAME = model_config["name"]
 PROMPT_TOKEN_COST = model_config["prompt_token_cost"]
 COMPLETION_TOKEN_COST = model_config["completion_token_cost"]
 
+# Exact-match cache of validated database selections
+_RESPONSE_CACHE = create_llm_cache()
+
+# Semantic cache of prior database selections, keyed on the research statement
+_PLAN_CACHE = SemanticCache(
+    threshold=config.SEMANTIC_CACHE_THRESHOLD,
+    max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+)
+
 
 def create_database_selection_plan(
     research_statement, token, available_databases, is_continuation=False, apg_catalog_context=None
@@ -220,16 +415,24 @@ def create_database_selection_plan(
         PlannerError: If there is an error in creating the database selection plan.
     """
     usage_details = None  # Initialize usage details
+    embedding_usage = None
+    cache_key = None
     try:
         # Generate dynamic configuration with filtered databases
         agent_config = load_agent_config(available_databases)
         system_prompt = agent_config["system_prompt"]
         tool_definitions = agent_config["tool_definitions"]
         system_message = {"role": "system", "content": system_prompt}
+        dynamic_context_message = {
+            "role": "system",
+            "content": agent_config["dynamic_context"],
+        }
 
         # Prepare the research statement as user message
         continuation_prefix = "[CONTINUATION REQUEST] " if is_continuation else ""
         user_content = f"{continuation_prefix}Research Statement: {research_statement}"
+
+        statement_content = user_content
         
         # Add apg_catalog context if available
         if apg_catalog_context and len(apg_catalog_context) > 0:
@@ -246,14 +449,49 @@ def create_database_selection_plan(
             "content": user_content,
         }
 
-        # Prepare messages for the API call
-        messages = [system_message, research_message]
+        # Deterministic calls (temperature 0) can be served from the exact-match cache
+        if config.LLM_CACHE_ENABLED and TEMPERATURE == 0:
+            cache_key = make_cache_key(
+                MODEL_NAME,
+                [research_message],
+                tool_definitions,
+                PLANNER_TOOL_CHOICE,
+                agent_config["template_version"],
+                context=agent_config["dynamic_context"],
+            )
+            cached_databases = _RESPONSE_CACHE.get(cache_key)
+            if cached_databases is not None:
+                logger.debug("Database selection plan served from exact-match cache")
+                return {"databases": list(cached_databases)}, None
+
+        # Check the semantic cache before paying for an LLM call. The embedding
+        # only covers the statement, so plans driven by catalog context (which
+        # takes priority in the prompt) are neither served from nor added to it.
+        cache_embedding = None
+        cache_namespace = tuple(sorted(available_databases))
+        if config.SEMANTIC_CACHE_ENABLED and not apg_catalog_context:
+            cache_embedding, embedding_usage = embed_text(statement_content, token)
+            if cache_embedding is not None:
+                cached_databases = _PLAN_CACHE.lookup(cache_embedding, cache_namespace)
+                if cached_databases is not None:
+                    logger.debug("Database selection plan served from semantic cache")
+                    return {"databases": list(cached_databases)}, embedding_usage
+
+        # Coalesce with a concurrent identical request (in this process or another replica)
+        if cache_key is not None:
+            cached_databases = _RESPONSE_CACHE.claim(cache_key)
+            if cached_databases is not None:
+                logger.debug("Database selection plan served by a concurrent identical request")
+                return {"databases": list(cached_databases)}, embedding_usage
+
+        # Prepare messages for the API call (static prefix first, dynamic content last)
+        messages = [system_message, dynamic_context_message, research_message]
 
         # Database information is included in the SYSTEM_PROMPT
 
         logger.debug("Creating database selection plan")
-        logger.debug(f"Is continuation: {is_continuation}")
-        logger.debug(f"Number of available databases: {len(available_databases)}")
+        logger.debug("Is continuation: %s", is_continuation)
+        logger.debug("Number of available databases: %d", len(available_databases))
 
         # Tool definitions already loaded from agent_config above
 
@@ -265,61 +503,135 @@ def create_database_selection_plan(
             max_tokens=MAX_TOKENS,
             temperature=TEMPERATURE,
             tools=tool_definitions,
-            tool_choice={
-                "type": "function",
-                "function": {"name": PLANNER_TOOL_NAME},
-            },  # Use new tool name
+            tool_choice=PLANNER_TOOL_CHOICE,
             stream=False,
             prompt_token_cost=PROMPT_TOKEN_COST,
             completion_token_cost=COMPLETION_TOKEN_COST,
         )
 
-        # Check if response object itself is valid before accessing attributes
-        if not response or not hasattr(response, "choices") or not response.choices:
-            raise PlannerError("Invalid or empty response received from LLM")
+        arguments = _extract_tool_arguments(response, PLANNER_TOOL_NAME)
+        validated_databases = validate_selected_databases(
+            arguments.get("databases", []), available_databases
+        )
 
-        # Extract the tool call from the response
-        message = response.choices[0].message
-        if not message or not message.tool_calls:
-            logger.warning("Expected tool call but received content instead")
-            raise PlannerError(
-                "No tool call received in response, content returned instead."
-            )
+        logger.debug("Database selection plan created with %d databases", len(validated_databases))
 
-        tool_call = message.tool_calls[0]
+        if cache_key is not None:
+            _RESPONSE_CACHE.set(cache_key, tuple(validated_databases))
+        if cache_embedding is not None:
+            _PLAN_CACHE.add(cache_embedding, tuple(validated_databases), cache_namespace)
 
-        # Verify that the correct function was called
-        if tool_call.function.name != PLANNER_TOOL_NAME:
-            raise PlannerError(f"Unexpected function call: {tool_call.function.name}")
+        # Return both plan and usage details (including the cache lookup embedding)
+        return {"databases": validated_databases}, merge_usage_details(
+            embedding_usage, usage_details
+        )
 
-        # Parse the arguments
-        try:
-            arguments = json.loads(tool_call.function.arguments)
-        except json.JSONDecodeError as e:
-            raise PlannerError("Invalid JSON in tool call arguments") from e
+    except PlannerError:
+        if cache_key is not None:
+            _RESPONSE_CACHE.release(cache_key)
+        raise  # Re-raise specific PlannerError exceptions
+    except Exception as e:
+        if cache_key is not None:
+            _RESPONSE_CACHE.release(cache_key)
+        logger.error("Error creating database selection plan")
+        raise PlannerError("Failed to create database selection plan") from e
+
+
+def create_database_selection_plans(
+    research_statements, token, available_databases, is_continuation=False, batch_size=PLANNER_BATCH_SIZE
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Create database selection plans for several research statements.
+
+    Statements are marshaled into numbered rows so that up to `batch_size` of
+    them share a single LLM call (and a single copy of the system prompt).
 
-        # Extract selected databases
-        selected_databases = arguments.get("databases", [])
+    Args:
+        research_statements (list): Research statements to plan
+        token (str): Authentication token for API access
+        available_databases (dict): Dictionary of available database configurations (filtered by user selection)
+        is_continuation (bool, optional): Whether these continue previous research.
+        batch_size (int, optional): Maximum statements per LLM call.
 
-        if not selected_databases:
-            raise PlannerError("Missing or empty 'databases' in tool arguments")
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            - Database selection plans, in the same order as `research_statements`.
+            - Usage details dictionaries, one per LLM call made.
 
-        # Validate selected databases
-        validated_databases = []
-        for i, db_name in enumerate(selected_databases):
-            if not isinstance(db_name, str):
-                raise PlannerError(f"Database entry {i+1} is not a string: {db_name}")
-            if db_name not in available_databases:
-                raise PlannerError(f"Selected database {i+1} is unknown: {db_name}")
-            validated_databases.append(db_name)
+    Raises:
+        PlannerError: If there is an error in creating any of the plans.
+    """
+    if batch_size < 1:
+        raise PlannerError("batch_size must be at least 1")
 
-        logger.debug(f"Database selection plan created with {len(validated_databases)} databases")
+    plans: List[Dict[str, Any]] = []
+    usage_details_list: List[Dict[str, Any]] = []
+    try:
+        agent_config = load_agent_config(available_databases)
+        system_message = {"role": "system", "content": agent_config["system_prompt"]}
+        dynamic_context_message = {
+            "role": "system",
+            "content": agent_config["dynamic_context"],
+        }
+        continuation_prefix = "[CONTINUATION REQUEST] " if is_continuation else ""
 
-        # Return both plan and usage details
-        return {"databases": validated_databases}, usage_details
+        for start in range(0, len(research_statements), batch_size):
+            batch = research_statements[start : start + batch_size]
+            rows = "\n".join(
+                f"[{i}] {statement}" for i, statement in enumerate(batch, 1)
+            )
+            research_message = {
+                "role": "user",
+                "content": (
+                    f"{continuation_prefix}Research Statements:\n{rows}\n\n"
+                    f"Select databases for each numbered statement independently and submit "
+                    f"all {len(batch)} plans in one call to {PLANNER_BATCH_TOOL_NAME}, "
+                    f"using each statement's number as its id."
+                ),
+            }
+
+            logger.debug("Creating batched database selection plans for %d statements", len(batch))
+
+            response, usage_details = call_llm(
+                oauth_token=token,
+                model=MODEL_NAME,
+                messages=[system_message, dynamic_context_message, research_message],
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE,
+                tools=_load_batch_tool_definitions(tuple(available_databases), len(batch)),
+                tool_choice=PLANNER_BATCH_TOOL_CHOICE,
+                stream=False,
+                prompt_token_cost=PROMPT_TOKEN_COST,
+                completion_token_cost=COMPLETION_TOKEN_COST,
+            )
+            if usage_details:
+                usage_details_list.append(usage_details)
+
+            arguments = _extract_tool_arguments(response, PLANNER_BATCH_TOOL_NAME)
+            plans_by_id = {}
+            for plan in arguments.get("plans", []):
+                if not isinstance(plan, dict):
+                    continue
+                # Models sometimes return the integer id as a string
+                try:
+                    plans_by_id[int(plan.get("id"))] = plan.get("databases", [])
+                except (TypeError, ValueError):
+                    logger.warning("Ignoring batched plan with invalid id: %r", plan.get("id"))
+            for i in range(1, len(batch) + 1):
+                if i not in plans_by_id:
+                    raise PlannerError(f"Missing plan for research statement {start + i}")
+                plans.append(
+                    {
+                        "databases": validate_selected_databases(
+                            plans_by_id[i], available_databases
+                        )
+                    }
+                )
+
+        return plans, usage_details_list
 
     except PlannerError:
         raise  # Re-raise specific PlannerError exceptions
     except Exception as e:
-        logger.error("Error creating database selection plan")
-        raise PlannerError("Failed to create database selection plan") from e
+        logger.error("Error creating batched database selection plans")
+        raise PlannerError("Failed to create batched database selection plans") from e
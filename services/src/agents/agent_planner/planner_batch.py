@@ -0,0 +1,199 @@
+# services/src/agents/agent_planner/planner_batch.py
+"""
+Planner Batch Module
+
+This module submits database selection plans for non-interactive workloads
+(evaluation runs, backfills, scheduled re-planning) through the OpenAI Batch
+API, which is billed at a discount relative to synchronous calls. Each
+research statement becomes one request line using the same prompt, tools and
+tool choice as the interactive planner, and results are validated with the
+planner's own validation step.
+
+Functions:
+    submit_plans: Submits research statements to the Batch API
+    collect_plans: Collects and validates the plans of a completed batch
+
+Dependencies:
+    - json
+    - logging
+    - OpenAI connector for batch calls
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from ...llm_connectors import fast_json
+from ...llm_connectors.rbc_openai import retrieve_batch_results, submit_batch
+from .planner import (
+    MAX_TOKENS,
+    MODEL_NAME,
+    PLANNER_TOOL_CHOICE,
+    PLANNER_TOOL_NAME,
+    TEMPERATURE,
+    PlannerError,
+    load_agent_config,
+    validate_selected_databases,
+)
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+# Prefix for batch request custom IDs; the suffix is the statement index
+CUSTOM_ID_PREFIX = "plan-"
+
+
+def submit_plans(
+    research_statements: List[str],
+    token: str,
+    available_databases: Dict[str, Any],
+    is_continuation: bool = False,
+) -> str:
+    """
+    Submit database selection plans for several research statements as a batch.
+
+    Args:
+        research_statements (list): Research statements to plan
+        token (str): Authentication token for API access
+        available_databases (dict): Dictionary of available database configurations
+        is_continuation (bool, optional): Whether these are continuation requests
+
+    Returns:
+        str: The batch ID, to be passed to collect_plans
+
+    Raises:
+        PlannerError: If the batch could not be submitted
+    """
+    if not research_statements:
+        raise PlannerError("No research statements provided for batch planning")
+
+    try:
+        agent_config = load_agent_config(available_databases)
+        static_messages = [
+            {"role": "system", "content": agent_config["system_prompt"]},
+            {"role": "system", "content": agent_config["dynamic_context"]},
+        ]
+        continuation_prefix = "[CONTINUATION REQUEST] " if is_continuation else ""
+
+        requests = [
+            {
+                "custom_id": f"{CUSTOM_ID_PREFIX}{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL_NAME,
+                    "messages": static_messages
+                    + [
+                        {
+                            "role": "user",
+                            "content": f"{continuation_prefix}Research Statement: {statement}",
+                        }
+                    ],
+                    "tools": agent_config["tool_definitions"],
+                    "tool_choice": PLANNER_TOOL_CHOICE,
+                    "max_tokens": MAX_TOKENS,
+                    "temperature": TEMPERATURE,
+                },
+            }
+            for index, statement in enumerate(research_statements)
+        ]
+
+        batch_id = submit_batch(oauth_token=token, requests=requests)
+        logger.info("Submitted %d planner requests as batch %s", len(requests), batch_id)
+        return batch_id
+
+    except PlannerError:
+        raise
+    except Exception as e:
+        logger.error("Error submitting planner batch: %s", str(e))
+        raise PlannerError(f"Failed to submit planner batch: {str(e)}") from e
+
+
+def _parse_result_line(result: Dict[str, Any], available_databases: Dict[str, Any]) -> List[str]:
+    """
+    Extract and validate the selected databases from one batch result line.
+
+    Args:
+        result (dict): Parsed line of the batch output file
+        available_databases (dict): Dictionary of available database configurations
+
+    Returns:
+        List[str]: Validated database names
+
+    Raises:
+        PlannerError: If the line holds an error or an invalid tool call
+    """
+    if result.get("error"):
+        raise PlannerError(f"Batch request failed: {result['error']}")
+
+    response = result.get("response") or {}
+    if response.get("status_code") != 200:
+        raise PlannerError(f"Batch request returned status {response.get('status_code')}")
+
+    try:
+        tool_call = response["body"]["choices"][0]["message"]["tool_calls"][0]["function"]
+    except (KeyError, IndexError, TypeError) as e:
+        raise PlannerError("No tool calls found in batch response") from e
+
+    if tool_call.get("name") != PLANNER_TOOL_NAME:
+        raise PlannerError(f"Unexpected function call: {tool_call.get('name')}")
+
+    try:
+        arguments = fast_json.loads(tool_call.get("arguments") or "{}")
+    except json.JSONDecodeError as e:
+        raise PlannerError("Invalid JSON in tool arguments") from e
+
+    return validate_selected_databases(arguments.get("databases", []), available_databases)
+
+
+def collect_plans(
+    batch_id: str, token: str, available_databases: Dict[str, Any]
+) -> Optional[Dict[int, Dict[str, Any]]]:
+    """
+    Collect the database selection plans of a submitted batch.
+
+    Requests that failed or produced an invalid selection are logged and left
+    out of the result, so callers should re-plan any missing indexes.
+
+    Args:
+        batch_id (str): The batch ID returned by submit_plans
+        token (str): Authentication token for API access
+        available_databases (dict): Dictionary of available database configurations
+
+    Returns:
+        Optional[Dict[int, Dict[str, Any]]]: Plans keyed by research statement index,
+            or None if the batch has not completed yet
+
+    Raises:
+        PlannerError: If the batch failed, expired or could not be retrieved
+    """
+    try:
+        status, results = retrieve_batch_results(oauth_token=token, batch_id=batch_id)
+    except Exception as e:
+        logger.error("Error retrieving planner batch %s: %s", batch_id, str(e))
+        raise PlannerError(f"Failed to retrieve planner batch: {str(e)}") from e
+
+    if status in ("failed", "expired", "cancelled"):
+        raise PlannerError(f"Planner batch {batch_id} ended with status '{status}'")
+    if status != "completed":
+        logger.debug("Planner batch %s not complete (status: %s)", batch_id, status)
+        return None
+
+    plans = {}
+    for result in results:
+        custom_id = result.get("custom_id", "")
+        if not custom_id.startswith(CUSTOM_ID_PREFIX):
+            logger.warning("Ignoring batch result with unexpected custom_id: %s", custom_id)
+            continue
+        try:
+            index = int(custom_id[len(CUSTOM_ID_PREFIX):])
+        except ValueError:
+            logger.warning("Ignoring batch result with malformed custom_id: %s", custom_id)
+            continue
+        try:
+            plans[index] = {"databases": _parse_result_line(result, available_databases)}
+        except PlannerError as e:
+            logger.warning("Skipping planner batch result %s: %s", custom_id, str(e))
+
+    logger.info("Collected %d plans from batch %s", len(plans), batch_id)
+    return plans
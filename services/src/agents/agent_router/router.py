@@ -16,6 +16,8 @@ Dependencies:
     - OpenAI connector for LLM calls
 """
 
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -23,16 +25,25 @@ import yaml
 from typing import Tuple, Dict, Optional, Any
 
 from ...initial_setup.env_config import config
-from ...llm_connectors.rbc_openai import call_llm
+from ...llm_connectors import fast_json
+from ...llm_connectors.rbc_openai import call_llm, merge_usage_details
+from ...llm_connectors.llm_cache import create_llm_cache, make_cache_key
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.fiscal_statement import get_fiscal_statement
 from ...global_prompts.database_statement import get_database_statement, get_filtered_database_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from .router_cache import cache_route, get_cached_route
+from .router_classifier import observe_route, predict_route
+from .router_rules import try_rule_based_route
 
 # Get module logger (no configuration here - using centralized config)
 logger = logging.getLogger(__name__)
 
 
+# Forced tool choice, shared across calls
+_TOOL_CHOICE = {"type": "function", "function": {"name": "route_query"}}
+
+
 class RouterError(Exception):
     """Base exception class for router-related errors."""
 
@@ -46,6 +57,8 @@ def load_agent_config(available_databases=None):
     """
     Load agent configuration from YAML file and resolve dynamic context.
     NOTE: Router can optionally use available_databases for filtered database_statement
+    NOTE: The prompt is kept static (no timestamps, no fiscal statement) so it forms a
+          stable cacheable prefix; get_routing_decision sends the fiscal statement after it.
 
     Args:
         available_databases (dict, optional): Dictionary of available database configurations
@@ -54,19 +67,20 @@ def load_agent_config(available_databases=None):
         dict: Configuration dictionary with resolved system prompt and settings
     """
     try:
-        # Build context statements dynamically
-        context_parts = [get_project_statement(), get_fiscal_statement()]
-
         # Handle database statement - use filtered version if available_databases provided
         if available_databases is not None:
-            context_parts.append(get_filtered_database_statement(available_databases))
+            database_statement = get_filtered_database_statement(
+                available_databases, include_timestamp=False
+            )
         else:
-            context_parts.append(get_database_statement())
+            database_statement = get_database_statement(include_timestamp=False)
 
-        context_parts.append(get_restrictions_statement())
-
-        # Build the complete context block
-        context_block = "\n\n".join(context_parts)
+        # Build the complete context block (fixed shape, so a single template)
+        context_block = (
+            f"{get_project_statement(include_timestamp=False)}\n\n"
+            f"{database_statement}\n\n"
+            f"{get_restrictions_statement()}"
+        )
 
         # Read and parse the YAML file
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -85,12 +99,18 @@ def load_agent_config(available_databases=None):
         capability = model_config.get("capability", "small")  # Default fallback
         max_tokens = model_config.get("max_tokens", 4096)
         temperature = model_config.get("temperature", 0.0)
+        max_history_messages = yaml_config.get("conversation", {}).get(
+            "max_history_messages", 6
+        )
 
-        # Extract system prompt from YAML
-        system_prompt = yaml_config.get("system_prompt", "")
+        # Extract system prompt from YAML (surrounding whitespace would only cost tokens)
+        system_prompt = yaml_config.get("system_prompt", "").strip()
         if not system_prompt:
             raise RouterError("System prompt not found in configuration")
 
+        # Identify the prompt template so response caches invalidate when it changes
+        template_version = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
         # Replace the context placeholder
         system_prompt = system_prompt.replace(
             "{{CONTEXT_START}}", f"<CONTEXT>\n{context_block}\n</CONTEXT>"
@@ -127,6 +147,8 @@ def load_agent_config(available_databases=None):
             "temperature": temperature,
             "system_prompt": system_prompt,
             "tool_definitions": tools,
+            "template_version": template_version,
+            "max_history_messages": max_history_messages,
         }
 
     except RouterError:
@@ -136,25 +158,55 @@ def load_agent_config(available_databases=None):
         raise RouterError("Failed to load agent configuration") from e
 
 
-# Load configuration once at module level
-try:
-    _config = load_agent_config()
-    MODEL_CAPABILITY = _config["model_capability"]
-    MAX_TOKENS = _config["max_tokens"]
-    TEMPERATURE = _config["temperature"]
-    SYSTEM_PROMPT = _config["system_prompt"]
-    TOOL_DEFINITIONS = _config["tool_definitions"]
-
-    # Get model configuration based on capability
-    model_config = config.get_model_config(MODEL_CAPABILITY)
-    MODEL_NAME = model_config["name"]
-    PROMPT_TOKEN_COST = model_config["prompt_token_cost"]
-    COMPLETION_TOKEN_COST = model_config["completion_token_cost"]
+@functools.lru_cache(maxsize=1)
+def _load_default_config() -> Dict[str, Any]:
+    """
+    Load and memoize the default (unfiltered) router configuration.
 
+    Loaded on first use rather than at import, so processes that import this
+    module but never route do not assemble the prompt.
 
-except Exception as e:
-    logger.error("Failed to initialize router agent configuration")
-    raise
+    Returns:
+        dict: Agent configuration plus the resolved model name and token costs
+    """
+    try:
+        agent_config = load_agent_config()
+        model_config = config.get_model_config(agent_config["model_capability"])
+    except Exception:
+        logger.error("Failed to initialize router agent configuration")
+        raise
+    return {
+        **agent_config,
+        "model_name": model_config["name"],
+        "prompt_token_cost": model_config["prompt_token_cost"],
+        "completion_token_cost": model_config["completion_token_cost"],
+    }
+
+
+# Module attributes resolved lazily from the default configuration (PEP 562)
+_LAZY_CONFIG_ATTRIBUTES = {
+    "MODEL_CAPABILITY": "model_capability",
+    "MAX_TOKENS": "max_tokens",
+    "TEMPERATURE": "temperature",
+    "SYSTEM_PROMPT": "system_prompt",
+    "TOOL_DEFINITIONS": "tool_definitions",
+    "TEMPLATE_VERSION": "template_version",
+    "MAX_HISTORY_MESSAGES": "max_history_messages",
+    "MODEL_NAME": "model_name",
+    "PROMPT_TOKEN_COST": "prompt_token_cost",
+    "COMPLETION_TOKEN_COST": "completion_token_cost",
+}
+
+
+def __getattr__(name):
+    config_key = _LAZY_CONFIG_ATTRIBUTES.get(name)
+    if config_key is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_default_config()[config_key]
+
+
+# Exact-match cache of routing decisions
+_RESPONSE_CACHE = create_llm_cache()
 
 
 def get_routing_decision(
@@ -179,48 +231,123 @@ def get_routing_decision(
         RouterError: If there is an error in getting the routing decision.
     """
     usage_details = None  # Initialize usage details
+    cache_key = None
     try:
+        settings = _load_default_config()
+
+        # Clear-cut turns (greetings, explicit searches, bank + metric, follow-ups) skip the LLM
+        if config.ROUTER_RULES_ENABLED:
+            rule_function_name = try_rule_based_route(
+                (conversation.get("messages") or []) if conversation else []
+            )
+            if rule_function_name:
+                logger.debug("Routing decision from rule pre-filter: %s", rule_function_name)
+                return {"function_name": rule_function_name}, None
+
         # Generate dynamic configuration with filtered databases if provided
         if available_databases is not None:
             agent_config = load_agent_config(available_databases)
             system_prompt = agent_config["system_prompt"]
         else:
-            system_prompt = SYSTEM_PROMPT
+            system_prompt = settings["system_prompt"]
+
+        # Routing only needs recent context; the latest user turn is always kept
+        all_messages = (conversation.get("messages") or []) if conversation else []
+        conversation_messages = all_messages[-settings["max_history_messages"]:]
+
+        # The date-bearing fiscal statement is sent with every call, so it is part of the key
+        fiscal_statement = get_fiscal_statement()
+
+        # Deterministic calls (temperature 0) can be served from the exact-match cache
+        if config.LLM_CACHE_ENABLED and settings["temperature"] == 0:
+            cache_key = make_cache_key(
+                settings["model_name"],
+                conversation_messages,
+                settings["tool_definitions"],
+                _TOOL_CHOICE,
+                settings["template_version"],
+                context={
+                    "databases": (
+                        sorted(available_databases) if available_databases is not None else None
+                    ),
+                    "fiscal_statement": fiscal_statement,
+                },
+            )
+            cached_function_name = _RESPONSE_CACHE.get(cache_key)
+            if cached_function_name is not None:
+                logger.debug("Routing decision served from exact-match cache")
+                return {"function_name": cached_function_name}, None
+
+        # The classifier only sees the last user message, so it is limited to
+        # opening turns, with centroids kept per set of available databases
+        use_classifier = config.ROUTER_CLASSIFIER_ENABLED and not any(
+            msg.get("role") == "assistant" for msg in all_messages[:-1]
+        )
+        classifier_namespace = (
+            tuple(sorted(available_databases)) if available_databases is not None else None
+        )
+
+        # Check the semantic cache using the normalized latest user message, then
+        # the embedding classifier; both reuse the same embedding call
+        route_lookup = None
+        if (
+            config.SEMANTIC_CACHE_ENABLED or use_classifier
+        ) and conversation_messages:
+            route_lookup = get_cached_route(conversation_messages, token, available_databases)
+            if route_lookup.function_name is not None:
+                return {"function_name": route_lookup.function_name}, route_lookup.usage_details
+            if use_classifier and route_lookup.embedding is not None:
+                predicted_function_name = predict_route(
+                    route_lookup.embedding, classifier_namespace
+                )
+                if predicted_function_name is not None:
+                    return {"function_name": predicted_function_name}, route_lookup.usage_details
+
+        # Coalesce with a concurrent identical request (in this process or another replica)
+        if cache_key is not None:
+            cached_function_name = _RESPONSE_CACHE.claim(cache_key)
+            if cached_function_name is not None:
+                logger.debug("Routing decision served by a concurrent identical request")
+                return {"function_name": cached_function_name}, (
+                    route_lookup.usage_details if route_lookup is not None else None
+                )
 
         # Prepare system message with router prompt
         system_message = {"role": "system", "content": system_prompt}
 
-        # Prepare the messages for the API call
-        messages = [system_message]
-        if conversation and "messages" in conversation:
-            messages.extend(conversation["messages"])
+        # Prepare the messages for the API call; the date-bearing fiscal statement
+        # follows the static prompt so it does not break the cached prefix
+        messages = [
+            system_message,
+            {"role": "system", "content": fiscal_statement},
+            *conversation_messages,
+        ]
 
-        logger.debug(f"Getting routing decision using model: {MODEL_NAME}")
+        logger.debug("Getting routing decision using model: %s", settings["model_name"])
 
         # Make the API call with tool calling (non-streaming returns tuple)
         response, usage_details = call_llm(
             oauth_token=token,
-            model=MODEL_NAME,
+            model=settings["model_name"],
             messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=TEMPERATURE,
-            tools=TOOL_DEFINITIONS,
-            tool_choice={
-                "type": "function",
-                "function": {"name": "route_query"},
-            },  # Force tool call
+            max_tokens=settings["max_tokens"],
+            temperature=settings["temperature"],
+            tools=settings["tool_definitions"],
+            tool_choice=_TOOL_CHOICE,  # Force tool call
             stream=False,
-            prompt_token_cost=PROMPT_TOKEN_COST,
-            completion_token_cost=COMPLETION_TOKEN_COST,
+            prompt_token_cost=settings["prompt_token_cost"],
+            completion_token_cost=settings["completion_token_cost"],
         )
 
         # Check if response object itself is valid before accessing attributes
-        if not response or not hasattr(response, "choices") or not response.choices:
+        choices = getattr(response, "choices", None)
+        if not choices:
             raise RouterError("Invalid or empty response received from LLM")
 
         # Extract the tool call from the response
-        message = response.choices[0].message
-        if not message or not message.tool_calls:
+        message = choices[0].message
+        tool_calls = message.tool_calls if message else None
+        if not tool_calls:
             # Handle cases where the model might return content instead of a tool call
             logger.warning("Expected tool call but received content instead")
             # Decide on fallback behavior - perhaps default routing or raise error
@@ -229,16 +356,16 @@ def get_routing_decision(
                 "No tool call received in response, content returned instead."
             )
 
-        tool_call = message.tool_calls[0]
+        function = tool_calls[0].function
 
         # Verify that the correct function was called
-        if tool_call.function.name != "route_query":
-            msg = f"Unexpected function call: {tool_call.function.name}"
+        if function.name != "route_query":
+            msg = f"Unexpected function call: {function.name}"
             raise RouterError(msg)
 
         # Parse the arguments
         try:
-            arguments = json.loads(tool_call.function.arguments)
+            arguments = fast_json.loads(function.arguments)
         except json.JSONDecodeError as e:
             raise RouterError("Invalid JSON in tool call arguments") from e
 
@@ -248,13 +375,28 @@ def get_routing_decision(
         if not function_name:
             raise RouterError("Missing 'function_name' in tool arguments")
 
-        logger.debug(f"Routing decision: {function_name}")
+        logger.debug("Routing decision: %s", function_name)
+
+        if cache_key is not None:
+            _RESPONSE_CACHE.set(cache_key, function_name)
+        if route_lookup is not None and route_lookup.embedding is not None:
+            if config.SEMANTIC_CACHE_ENABLED:
+                cache_route(route_lookup, function_name)
+            if use_classifier:
+                observe_route(route_lookup.embedding, function_name, classifier_namespace)
 
-        # Return both decision and usage details
-        return {"function_name": function_name}, usage_details
+        # Return both decision and usage details (including the route lookup embedding)
+        lookup_usage = route_lookup.usage_details if route_lookup is not None else None
+        return {"function_name": function_name}, merge_usage_details(
+            lookup_usage, usage_details
+        )
 
     except RouterError:
+        if cache_key is not None:
+            _RESPONSE_CACHE.release(cache_key)
         raise  # Re-raise specific RouterError exceptions
     except Exception as e:
+        if cache_key is not None:
+            _RESPONSE_CACHE.release(cache_key)
         logger.error("Error getting routing decision")
         raise RouterError("Failed to get routing decision") from e
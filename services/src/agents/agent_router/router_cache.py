@@ -0,0 +1,144 @@
+# services/src/agents/agent_router/router_cache.py
+"""
+Router Semantic Cache Module
+
+Caches routing decisions against an embedding of the normalized latest user
+message. Entries are namespaced by the available databases and a short hash
+of the recent assistant turns, so a follow-up question is only matched
+against decisions made in the same conversational context. The router's
+output is a two-valued enum, so near-duplicate hits are safe to reuse.
+
+Classes:
+    RouteLookup: Result of a cache lookup, passed back to cache_route on a miss
+
+Functions:
+    normalize_query: Normalizes user text before embedding
+    get_cached_route: Looks up a cached routing decision
+    cache_route: Stores a routing decision for a missed lookup
+
+Dependencies:
+    - hashlib
+    - re
+    - Semantic cache from llm_connectors
+"""
+
+import hashlib
+import logging
+import re
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+
+from ...initial_setup.env_config import config
+from ...llm_connectors.semantic_cache import SemanticCache, embed_text
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+# Number of most recent assistant turns that scope a cached decision
+CONTEXT_ASSISTANT_TURNS = 2
+
+# Common financial abbreviations, expanded so that both forms embed alike
+_ABBREVIATIONS = {
+    "yoy": "year over year",
+    "qoq": "quarter over quarter",
+    "eps": "earnings per share",
+    "nim": "net interest margin",
+    "pcl": "provision for credit losses",
+    "roe": "return on equity",
+    "cet1": "common equity tier 1",
+    "rbc": "royal bank of canada",
+    "bmo": "bank of montreal",
+    "bns": "bank of nova scotia",
+    "cibc": "canadian imperial bank of commerce",
+}
+_ABBREVIATION_RE = re.compile(r"\b(" + "|".join(_ABBREVIATIONS) + r")\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_ROUTE_CACHE = SemanticCache(
+    threshold=config.ROUTER_SEMANTIC_CACHE_THRESHOLD,
+    max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+)
+
+
+class RouteLookup(NamedTuple):
+    """Result of a routing cache lookup."""
+
+    function_name: Optional[str]
+    usage_details: Optional[Dict[str, Any]]
+    embedding: Optional[List[float]]
+    namespace: Hashable
+
+
+def normalize_query(text: str) -> str:
+    """
+    Normalize user text for embedding: lowercase, expand abbreviations, collapse whitespace.
+
+    Args:
+        text (str): Raw user message
+
+    Returns:
+        str: Normalized text
+    """
+    text = _WHITESPACE_RE.sub(" ", text.lower()).strip()
+    return _ABBREVIATION_RE.sub(lambda match: _ABBREVIATIONS[match.group(1)], text)
+
+
+def _context_hash(messages: List[Dict[str, Any]]) -> str:
+    """Return a short hash of the most recent assistant turns."""
+    assistant_turns = [
+        msg.get("content") or "" for msg in messages if msg.get("role") == "assistant"
+    ][-CONTEXT_ASSISTANT_TURNS:]
+    digest = hashlib.blake2b(digest_size=8)
+    for content in assistant_turns:
+        digest.update(content.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_cached_route(
+    messages: List[Dict[str, Any]],
+    token: Optional[str],
+    available_databases: Optional[Dict[str, Any]] = None,
+) -> RouteLookup:
+    """
+    Look up a cached routing decision for the latest user message.
+
+    Args:
+        messages (list): Conversation messages sent to the router
+        token (str): Authentication token for the embedding call
+        available_databases (dict, optional): Databases available to the user
+
+    Returns:
+        RouteLookup: `function_name` is set on a hit; on a miss, pass the lookup
+            to cache_route once the decision is known
+    """
+    namespace = (
+        tuple(sorted(available_databases)) if available_databases is not None else None,
+        _context_hash(messages),
+    )
+    last_user_content = next(
+        (msg.get("content") or "" for msg in reversed(messages) if msg.get("role") == "user"),
+        "",
+    )
+    if not last_user_content:
+        return RouteLookup(None, None, None, namespace)
+
+    embedding, usage_details = embed_text(normalize_query(last_user_content), token)
+    if embedding is None:
+        return RouteLookup(None, usage_details, None, namespace)
+
+    function_name = _ROUTE_CACHE.lookup(embedding, namespace)
+    if function_name is not None:
+        logger.debug("Routing decision served from semantic cache")
+    return RouteLookup(function_name, usage_details, embedding, namespace)
+
+
+def cache_route(lookup: RouteLookup, function_name: str) -> None:
+    """
+    Store a routing decision for a lookup that missed.
+
+    Args:
+        lookup (RouteLookup): The lookup returned by get_cached_route
+        function_name (str): The routing decision
+    """
+    if lookup.embedding is not None:
+        _ROUTE_CACHE.add(lookup.embedding, function_name, lookup.namespace)
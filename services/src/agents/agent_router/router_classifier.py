@@ -0,0 +1,162 @@
+# services/src/agents/agent_router/router_classifier.py
+"""
+Router Classifier Module
+
+A lightweight nearest-centroid classifier for the router's binary decision,
+trained online from the LLM's own routing decisions. Each route keeps the
+running mean of the (normalized) embeddings of the user messages routed to
+it; a new message is routed to the closest centroid only when it is clearly
+closer to one than the other. Messages inside the uncertainty band, or any
+message before both routes have enough samples, fall back to the LLM.
+
+Centroids are kept per namespace (the databases available to the user), and
+the router only consults or trains the classifier on opening turns: whether a
+follow-up like "summarize that" needs research depends on the conversation,
+which an embedding of the last user message does not capture.
+
+The embedding is the one already computed for the router's semantic cache,
+so a confident prediction replaces a chat completion with a vector compare.
+
+Classes:
+    CentroidRouteClassifier: Online nearest-centroid classifier
+
+Functions:
+    predict_route: Predicts a route for an embedding, or None if uncertain
+    observe_route: Adds an LLM routing decision to the classifier
+
+Dependencies:
+    - math
+    - threading
+"""
+
+import logging
+import math
+import threading
+from typing import Dict, Hashable, List, Optional
+
+from ...initial_setup.env_config import config
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+
+class CentroidRouteClassifier:
+    """
+    Online nearest-centroid classifier over message embeddings, with an
+    independent set of centroids per namespace.
+
+    Args:
+        min_samples (int): Samples each route needs before predictions are made
+        margin (float): Minimum cosine-similarity gap between the two closest
+            centroids for a prediction; smaller gaps are left to the LLM
+    """
+
+    def __init__(self, min_samples: int = 20, margin: float = 0.05):
+        self.min_samples = min_samples
+        self.margin = margin
+        self._sums: Dict[Hashable, Dict[str, List[float]]] = {}
+        self._counts: Dict[Hashable, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else list(vector)
+
+    def observe(
+        self, embedding: List[float], function_name: str, namespace: Hashable = None
+    ) -> None:
+        """
+        Add a labelled example.
+
+        Args:
+            embedding (List[float]): Embedding of the user message
+            function_name (str): Route the LLM chose for it
+            namespace (Hashable, optional): Namespace whose centroids to update
+        """
+        unit = self._normalize(embedding)
+        with self._lock:
+            sums = self._sums.setdefault(namespace, {})
+            counts = self._counts.setdefault(namespace, {})
+            total = sums.get(function_name)
+            if total is None:
+                sums[function_name] = unit
+            else:
+                sums[function_name] = [a + b for a, b in zip(total, unit)]
+            counts[function_name] = counts.get(function_name, 0) + 1
+
+    def predict(self, embedding: List[float], namespace: Hashable = None) -> Optional[str]:
+        """
+        Predict a route for an embedding.
+
+        Args:
+            embedding (List[float]): Embedding of the user message
+            namespace (Hashable, optional): Namespace whose centroids to compare
+
+        Returns:
+            Optional[str]: The predicted route, or None when the classifier is
+                not yet trained or the message falls inside the uncertainty band
+        """
+        with self._lock:
+            counts = self._counts.get(namespace) or {}
+            if len(counts) < 2 or min(counts.values()) < self.min_samples:
+                return None
+            centroids = {
+                name: self._normalize(total)
+                for name, total in self._sums[namespace].items()
+            }
+
+        unit = self._normalize(embedding)
+        scores = sorted(
+            (
+                (sum(a * b for a, b in zip(unit, centroid)), name)
+                for name, centroid in centroids.items()
+            ),
+            reverse=True,
+        )
+        (best_score, best_name), (second_score, _) = scores[0], scores[1]
+        if best_score - second_score < self.margin:
+            logger.debug(
+                "Router classifier uncertain (%.3f vs %.3f); deferring to LLM",
+                best_score,
+                second_score,
+            )
+            return None
+        return best_name
+
+
+_CLASSIFIER = CentroidRouteClassifier(
+    min_samples=config.ROUTER_CLASSIFIER_MIN_SAMPLES,
+    margin=config.ROUTER_CLASSIFIER_MARGIN,
+)
+
+
+def predict_route(embedding: List[float], namespace: Hashable = None) -> Optional[str]:
+    """
+    Predict a route with the shared classifier.
+
+    Args:
+        embedding (List[float]): Embedding of the latest user message
+        namespace (Hashable, optional): Classifier namespace (available databases)
+
+    Returns:
+        Optional[str]: The predicted route, or None to fall back to the LLM
+    """
+    function_name = _CLASSIFIER.predict(embedding, namespace)
+    if function_name is not None:
+        logger.debug("Routing decision from classifier: %s", function_name)
+    return function_name
+
+
+def observe_route(
+    embedding: List[float], function_name: str, namespace: Hashable = None
+) -> None:
+    """
+    Train the shared classifier with an LLM routing decision.
+
+    Args:
+        embedding (List[float]): Embedding of the latest user message
+        function_name (str): Route the LLM chose
+        namespace (Hashable, optional): Classifier namespace (available databases)
+    """
+    _CLASSIFIER.observe(embedding, function_name, namespace)
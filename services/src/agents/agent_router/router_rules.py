@@ -0,0 +1,127 @@
+# services/src/agents/agent_router/router_rules.py
+"""
+Router Rules Module
+
+Deterministic pre-filter for the router. Encodes the clear-cut cases of the
+router prompt's decision criteria as regex rules evaluated on the latest user
+message, so that those turns are routed without an LLM call:
+
+- Greetings and acknowledgements -> response_from_conversation
+- Explicit database searches -> research_from_database
+- A named bank together with a financial metric, when there is no previous
+  answer -> research_from_database (later turns may be follow-ups to it)
+- Requests to rework the previous answer (summarize/explain/tabulate that),
+  when there is a previous answer -> response_from_conversation
+
+When rules disagree, or none fires, the turn is left to the LLM.
+
+Functions:
+    try_rule_based_route: Returns the route for a clear-cut turn, or None
+
+Dependencies:
+    - re
+    - threading
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+RESPONSE_FROM_CONVERSATION = "response_from_conversation"
+RESEARCH_FROM_DATABASE = "research_from_database"
+
+# Whole-message patterns: anything longer still reaches the model
+_GREETING_RE = re.compile(
+    r"^(hi|hello|hey|good (morning|afternoon|evening)|howdy)( there| team| aegis)?[\s!.,]*$",
+    re.IGNORECASE,
+)
+_THANKS_RE = re.compile(
+    r"^(thanks|thank you|thx|ty|cheers|great|perfect|awesome|got it|ok(ay)?)"
+    r"( (so|very) much| again| a lot)?( for (the|your) help)?[\s!.,]*$",
+    re.IGNORECASE,
+)
+
+# Prefix pattern for searches that name a data source
+_EXPLICIT_SEARCH_RE = re.compile(
+    r"^(please )?(search|look up|lookup|look in|check|query|research) "
+    r"(the )?(earnings calls?|transcripts?|rts|benchmarking|supplementary|"
+    r"databases?|reports?)\b",
+    re.IGNORECASE,
+)
+
+# Keyword patterns for new information requests (bank + metric)
+_BANK_RE = re.compile(
+    r"\b(rbc|royal bank|td|toronto[- ]dominion|bmo|bank of montreal|bns|scotiabank|"
+    r"bank of nova scotia|cibc|national bank|nbc|jpm|jpmorgan|bank of america|bofa|"
+    r"citi(group)?|wells fargo|goldman sachs|morgan stanley|hsbc|barclays)\b",
+    re.IGNORECASE,
+)
+_METRIC_RE = re.compile(
+    r"\b(revenue|revenues|net income|earnings|eps|roe|return on equity|efficiency ratio|"
+    r"net interest margin|nim|pcl|provisions? for credit losses|cet1|capital ratio|"
+    r"expenses?|dividends?|deposits|loans|operating leverage|guidance|outlook)\b",
+    re.IGNORECASE,
+)
+
+# Follow-up patterns that rework the previous answer
+_FOLLOW_UP_RE = re.compile(
+    r"\b(based on what you (found|showed|said)|summari[sz]e (that|this|it|the above)|"
+    r"explain (that|this|the above)|(put|show) (that|this|it) in a table|in a table|"
+    r"(rephrase|reformat|shorten) (that|this|it))\b",
+    re.IGNORECASE,
+)
+
+# Rule match counters, logged to track the pre-filter hit rate
+_rule_stats = {"matched": 0, "total": 0}
+_rule_stats_lock = threading.Lock()
+
+
+def _classify(last_user: str, has_previous_answer: bool) -> Optional[str]:
+    """Apply the rules to the latest user message."""
+    if _GREETING_RE.match(last_user) or _THANKS_RE.match(last_user):
+        return RESPONSE_FROM_CONVERSATION
+    if _EXPLICIT_SEARCH_RE.match(last_user):
+        return RESEARCH_FROM_DATABASE
+
+    wants_follow_up = has_previous_answer and _FOLLOW_UP_RE.search(last_user) is not None
+    # Once there is an answer, a bank + metric turn may be a follow-up to it
+    wants_research = (
+        not has_previous_answer
+        and _BANK_RE.search(last_user) is not None
+        and _METRIC_RE.search(last_user) is not None
+    )
+    if wants_follow_up == wants_research:
+        # Neither rule fired, or both did: ambiguous, leave it to the LLM
+        return None
+    return RESPONSE_FROM_CONVERSATION if wants_follow_up else RESEARCH_FROM_DATABASE
+
+
+def try_rule_based_route(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Route the latest user turn with deterministic rules, without an LLM call.
+
+    Args:
+        messages (list): Conversation messages
+
+    Returns:
+        Optional[str]: The function name to route to, or None if no rule applies
+    """
+    if not messages or messages[-1].get("role") != "user":
+        return None
+
+    last_user = (messages[-1].get("content") or "").strip()
+    has_previous_answer = any(msg.get("role") == "assistant" for msg in messages[:-1])
+    function_name = _classify(last_user, has_previous_answer)
+
+    with _rule_stats_lock:
+        _rule_stats["total"] += 1
+        if function_name:
+            _rule_stats["matched"] += 1
+        matched, total = _rule_stats["matched"], _rule_stats["total"]
+    logger.debug("Routing rule pre-filter matched %d of %d turns", matched, total)
+
+    return function_name
@@ -5,7 +5,12 @@ Summarizer Agent Module (Async Version)
 This module is responsible for generating the final research summary based on
 the aggregated detailed research findings from various databases.
 
+Classes:
+    SummarizerSettings: Immutable settings resolved from the configuration
+
 Functions:
+    is_simple_summary: Sizes the model and prompt to the research volume and plan
+    research_is_ambiguous: Detects findings that benefit from the query plan
     generate_streaming_summary: Asynchronously generates a streaming summary.
 
 Dependencies:
@@ -14,21 +19,30 @@ Dependencies:
     - Typing for annotations
 """
 
+import functools
+import hashlib
 import logging
 import json
 import os
+import re
+import sys
 import yaml
-from typing import Any, Dict, List, Optional, Union, Generator
+from typing import Any, Dict, List, NamedTuple, Optional, Union, Generator
 
 from ...initial_setup.env_config import config
 from ...llm_connectors.rbc_openai import call_llm
 from ...global_prompts.project_statement import get_project_statement
 from ...global_prompts.fiscal_statement import get_fiscal_statement
 from ...global_prompts.restrictions_statement import get_restrictions_statement
+from ...global_prompts.database_statement import AVAILABLE_DATABASES
 
 # Get module logger
 logger = logging.getLogger(__name__)
 
+# Whitespace that costs prompt tokens without changing meaning
+_TRAILING_WHITESPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINE_RUN_RE = re.compile(r"\n{3,}")
+
 
 class SummarizerError(Exception):
     """Base exception class for summarizer-related errors."""
@@ -40,20 +54,18 @@ def load_agent_config():
     """
     Load agent configuration from YAML file and resolve dynamic context.
     NOTE: Summarizer excludes database_statement (unlike other agents)
+    NOTE: The system prompt is static (no timestamps, no fiscal statement) so that
+          it forms a stable cacheable prefix; the fiscal statement is sent per call.
 
     Returns:
         dict: Configuration dictionary with resolved system prompt and settings
     """
     try:
-        # Build context statements dynamically (excluding database_statement)
-        context_parts = [
-            get_project_statement(),
-            get_fiscal_statement(),
-            get_restrictions_statement(),  # Note: NO database_statement for summarizer
-        ]
-
-        # Build the complete context block
-        context_block = "\n\n".join(context_parts)
+        # Build the complete context block (excluding database_statement)
+        context_block = (
+            f"{get_project_statement(include_timestamp=False)}\n\n"
+            f"{get_restrictions_statement()}"  # Note: NO database_statement for summarizer
+        )
 
         # Read and parse the YAML file
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -72,9 +84,13 @@ def load_agent_config():
         capability = model_config.get("capability", "large")  # Default fallback
         max_tokens = model_config.get("max_tokens", 4096)
         temperature = model_config.get("temperature", 0.1)
+        small_capability = model_config.get("small_capability", "small")
+        small_max_complexity = model_config.get("small_max_complexity", 0)
 
-        # Extract system prompt from YAML
+        # Extract system prompt from YAML, dropping whitespace that only costs tokens
         system_prompt = yaml_config.get("system_prompt", "")
+        system_prompt = _TRAILING_WHITESPACE_RE.sub("", system_prompt)
+        system_prompt = _BLANK_LINE_RUN_RE.sub("\n\n", system_prompt).strip()
         if not system_prompt:
             raise SummarizerError("System prompt not found in configuration")
 
@@ -83,11 +99,23 @@ def load_agent_config():
             "{{CONTEXT_START}}", f"<CONTEXT>\n{context_block}\n</CONTEXT>"
         )
 
+        # Full variant carries the few-shot example; the compact one (simple summaries) omits it
+        example_output = yaml_config.get("example_output", "").strip()
+        compact_system_prompt = system_prompt.replace("\n\n{{EXAMPLE_OUTPUT}}", "")
+        system_prompt = system_prompt.replace("{{EXAMPLE_OUTPUT}}", example_output)
+
+        # Identify the assembled prompt once, so cache keys need not rehash it per call
+        system_prompt_sha = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+
         return {
             "model_capability": capability,
             "max_tokens": max_tokens,
             "temperature": temperature,
             "system_prompt": system_prompt,
+            "compact_system_prompt": compact_system_prompt,
+            "system_prompt_sha": system_prompt_sha,
+            "small_capability": small_capability,
+            "small_max_complexity": small_max_complexity,
         }
 
     except SummarizerError:
@@ -97,18 +125,139 @@ def load_agent_config():
         raise SummarizerError("Failed to load agent configuration") from e
 
 
-# Load configuration once at module level
-try:
-    _config = load_agent_config()
-    MODEL_CAPABILITY = _config["model_capability"]
-    MAX_TOKENS = _config["max_tokens"]
-    TEMPERATURE = _config["temperature"]
-    SYSTEM_PROMPT = _config["system_prompt"]
+class SummarizerSettings(NamedTuple):
+    """Immutable summarizer settings, resolved once per process."""
+
+    model_capability: str
+    max_tokens: int
+    temperature: float
+    system_prompt: str
+    compact_system_prompt: str
+    system_prompt_sha: str
+    small_capability: str
+    small_max_complexity: int
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_config() -> SummarizerSettings:
+    """
+    Load and memoize the summarizer configuration.
+
+    Loaded on first use rather than at import, so processes that import this
+    module but never summarize do not assemble the prompt.
+
+    Returns:
+        SummarizerSettings: Agent configuration (see load_agent_config)
+    """
+    try:
+        agent_config = load_agent_config()
+    except Exception:
+        logger.error("Failed to initialize summarizer agent configuration")
+        raise
+    return SummarizerSettings(**agent_config)
+
+
+# Module attributes resolved lazily from the configuration (PEP 562)
+_LAZY_CONFIG_ATTRIBUTES = {
+    "MODEL_CAPABILITY": "model_capability",
+    "MAX_TOKENS": "max_tokens",
+    "TEMPERATURE": "temperature",
+    "SYSTEM_PROMPT": "system_prompt",
+    "COMPACT_SYSTEM_PROMPT": "compact_system_prompt",
+    "SYSTEM_PROMPT_SHA": "system_prompt_sha",
+    "SMALL_MODEL_CAPABILITY": "small_capability",
+    "SMALL_MAX_COMPLEXITY": "small_max_complexity",
+}
+
+
+def __getattr__(name):
+    config_key = _LAZY_CONFIG_ATTRIBUTES.get(name)
+    if config_key is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_load_default_config(), config_key)
+
+
+# Display name per database ID, interned since the same names recur on every call.
+# Callers pass subsets of AVAILABLE_DATABASES, so one map serves every selection.
+_DB_DISPLAY = {
+    db_id: sys.intern(db_info.get("name", db_id))
+    for db_id, db_info in AVAILABLE_DATABASES.items()
+}
+
+
+def is_simple_summary(
+    aggregated_detailed_research: Dict[str, str],
+    original_query_plan: Optional[Dict] = None,
+) -> bool:
+    """
+    Decide whether a summary is simple enough for the small model and compact prompt.
+
+    Complexity is the total research length in characters plus 3 per planned
+    query. Single-database summaries below SMALL_MAX_COMPLEXITY are simple; they
+    use the small model and the system prompt without the few-shot example.
+
+    Args:
+        aggregated_detailed_research (dict): Detailed research keyed by database name.
+        original_query_plan (dict, optional): The original query plan.
+
+    Returns:
+        bool: True if the summary is simple.
+    """
+    small_max_complexity = _load_default_config().small_max_complexity
+    research = aggregated_detailed_research or {}
+    if not small_max_complexity or len(research) > 1:
+        return False
+
+    query_count = len((original_query_plan or {}).get("queries") or [])
+    complexity = (
+        sum(len(text) for text in research.values()) + 3 * query_count
+    )
+    if complexity < small_max_complexity:
+        logger.debug(
+            "Summary complexity %d below %d; using small model and compact prompt",
+            complexity,
+            small_max_complexity,
+        )
+        return True
+    return False
+
+
+# Final stream items shared across calls; consumers only read them, and can
+# identity-test (`is`) for the missing-usage case
+_MISSING_USAGE = {"usage_details": {"error": "Usage data missing from stream"}}
+_EMPTY_USAGE = {
+    "usage_details": {
+        "model": "none",
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cost": 0.0,
+        "response_time_ms": 0,
+    }
+}
+
+# Findings shorter than this, or containing a marker, are treated as ambiguous
+_AMBIGUOUS_RESEARCH_MIN_CHARS = 200
+_AMBIGUOUS_RESEARCH_MARKER = "unable to determine"
 
 
-except Exception as e:
-    logger.error("Failed to initialize summarizer agent configuration")
-    raise
+def research_is_ambiguous(aggregated_detailed_research: Dict[str, str]) -> bool:
+    """
+    Check whether any database's findings are too thin to stand on their own.
+
+    Ambiguous findings are summarized with the original query plan attached so
+    the model can see what each database was asked.
+
+    Args:
+        aggregated_detailed_research (dict): Detailed research keyed by database name.
+
+    Returns:
+        bool: True if any findings are short or report an undetermined answer.
+    """
+    return any(
+        len(text) < _AMBIGUOUS_RESEARCH_MIN_CHARS
+        or _AMBIGUOUS_RESEARCH_MARKER in text.lower()
+        for text in (aggregated_detailed_research or {}).values()
+    )
 
 
 # --- Main Synchronous Summarizer Function ---
@@ -118,14 +267,12 @@ def generate_streaming_summary(
     ],  # Input is now Dict[db_name, detailed_research_string]
     scope: str,  # Keep scope for potential future variations
     token: Optional[str],
-    available_databases: Dict[
-        str, Any
-    ],  # Available database configurations (filtered by user selection)
     research_statement: Optional[str] = None,  # Added research statement for query focus
     original_query_plan: Optional[Dict] = None,
     reference_index: Optional[
         Dict[str, Dict[str, Any]]
     ] = None,  # Added reference index
+    include_plan: bool = False,  # Always include the query plan (else only when ambiguous)
 ) -> Generator[Any, None, None]:  # Yields str or dict
     """
     Generate the final response based on aggregated detailed research.
@@ -142,8 +289,11 @@ def generate_streaming_summary(
                                              containing the detailed research string for each.
         scope (str): The scope of the original request ('research' primarily).
         token (str): Authentication token for API access.
+        research_statement (str, optional): The research statement to focus the summary on.
         original_query_plan (dict, optional): The original query plan (might be useful for context).
         reference_index (dict, optional): Master reference index mapping ref IDs to details.
+        include_plan (bool): Always add the original query plan to the prompt. By default
+                             it is only added when the findings are ambiguous.
 
     Returns:
     Yields:
@@ -158,9 +308,25 @@ def generate_streaming_summary(
 
     # --- Research Scope ---
     if scope == "research":
+        # Nothing to summarize: answer without an LLM call
+        if not aggregated_detailed_research:
+            logger.warning("No detailed research to summarize; skipping LLM call.")
+            yield (
+                "No research findings were retrieved for your query. "
+                "Please try rephrasing or widening your scope."
+            )
+            yield _EMPTY_USAGE
+            return
+
         try:
-            # Get model configuration dynamically
-            model_config = config.get_model_config(MODEL_CAPABILITY)
+            settings = _load_default_config()
+            # Size the model and prompt to the summary's complexity
+            simple_summary = is_simple_summary(
+                aggregated_detailed_research, original_query_plan
+            )
+            model_config = config.get_model_config(
+                settings.small_capability if simple_summary else settings.model_capability
+            )
             model_name = model_config["name"]
             prompt_token_cost = model_config["prompt_token_cost"]
             completion_token_cost = model_config["completion_token_cost"]
@@ -170,62 +336,73 @@ def generate_streaming_summary(
             raise SummarizerError("Configuration error") from config_err
 
         try:
-            # Prepare system message with summary prompt
-            system_message = {"role": "system", "content": SYSTEM_PROMPT}
-
-            # Prepare messages for the API call
-            messages = [system_message]
+            # The static system prompt (including the generation request) forms a
+            # byte-stable prefix for provider prompt caching; all per-request
+            # content follows it in a single user message.
+            system_message = {
+                "role": "system",
+                "content": (
+                    settings.compact_system_prompt if simple_summary else settings.system_prompt
+                ),
+            }
 
             # Format the aggregated detailed research for the prompt
-            research_context = "Aggregated Detailed Research Findings:\n\n"
-            if not aggregated_detailed_research:
-                research_context += (
-                    "No detailed research findings were provided or generated.\n"
-                )
-            else:
-                for db_name, research_text in aggregated_detailed_research.items():
-                    db_display_name = available_databases.get(db_name, {}).get(
-                        "name", db_name
-                    )
-                    research_context += f"=== Findings from: {db_display_name} ===\n"
-                    research_context += f"{research_text}\n\n"
-
-            context_message = {"role": "system", "content": research_context.strip()}
-            messages.append(context_message)
-
-            # Add original query plan details if available
-            if original_query_plan and original_query_plan.get("queries"):
-                plan_context = "Original Query Plan:\n"
-                for i, q in enumerate(original_query_plan["queries"]):
-                    db_identifier = q.get("database")
-                    db_display_name = available_databases.get(db_identifier, {}).get(
-                        "name", db_identifier
+            research_context = "\n\n".join(
+                [
+                    "Aggregated Detailed Research Findings:",
+                    *(
+                        f"=== Findings from: {_DB_DISPLAY.get(db_name, db_name)} ===\n"
+                        f"{research_text}"
+                        for db_name, research_text in aggregated_detailed_research.items()
+                    ),
+                ]
+            ).strip()
+
+            # Dynamic context (the date) follows the static prefix
+            user_sections = [get_fiscal_statement()]
+            if research_statement:
+                user_sections.append(f"Research Statement: {research_statement}")
+            user_sections.append(research_context)
+
+            # Add original query plan details only when they add information
+            if (
+                original_query_plan
+                and original_query_plan.get("queries")
+                and (include_plan or research_is_ambiguous(aggregated_detailed_research))
+            ):
+                user_sections.append(
+                    "\n".join(
+                        [
+                            "Original Query Plan:",
+                            *(
+                                f"{i}. {_DB_DISPLAY.get(q.get('database'), q.get('database'))}"
+                                f": {q.get('query')}"
+                                for i, q in enumerate(original_query_plan["queries"], 1)
+                            ),
+                        ]
                     )
-                    plan_context += f"{i+1}. {db_display_name}: {q.get('query')}\n"
-                messages.append({"role": "system", "content": plan_context.strip()})
+                )
 
             # Add reference index information if available
             if reference_index:
-                ref_context = "Available References:\n"
-
-                for ref_id, ref_data in reference_index.items():
-                    doc_name = ref_data.get("doc_name", "Unknown")
-                    page = ref_data.get("page", 1)
-                    ref_context += f"[REF:{ref_id}] = {doc_name} - Page {page}\n"
-
-                messages.append({"role": "system", "content": ref_context.strip()})
+                user_sections.append(
+                    "\n".join(
+                        [
+                            "Available References:",
+                            *(
+                                f"[REF:{ref_id}] = {ref_data.get('doc_name', 'Unknown')}"
+                                f" - Page {ref_data.get('page', 1)}"
+                                for ref_id, ref_data in reference_index.items()
+                            ),
+                        ]
+                    )
+                )
 
-            # User message requesting summary with research statement context
-            user_content = "Please generate the comprehensive research summary based on the provided context and requirements. Synthesize the findings from all sources into a single, coherent response following the specified template and citation format."
-            
-            if research_statement:
-                user_content = f"Research Statement: {research_statement}\n\n{user_content}\n\nIMPORTANT: Focus your response on directly addressing the research statement above. Prioritize information that answers the specific question asked and avoid including tangential research that doesn't support the core query."
-            
             user_message = {
                 "role": "user",
-                "content": user_content,
+                "content": "\n\n".join(user_sections),
             }
-            messages.append(user_message)
+            messages = [system_message, user_message]
 
             logger.debug(
                 f"Generating streaming research summary using model: {model_name}"
@@ -240,8 +417,8 @@ def generate_streaming_summary(
                 oauth_token=token,
                 model=model_name,
                 messages=messages,
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE,
+                max_tokens=settings.max_tokens,
+                temperature=settings.temperature,
                 stream=True,  # Keep streaming enabled
                 prompt_token_cost=prompt_token_cost,
                 completion_token_cost=completion_token_cost,
@@ -250,17 +427,19 @@ def generate_streaming_summary(
 
             # Process the stream, yielding content and capturing final usage details
             for item in llm_stream:
-                if isinstance(item, dict) and "usage_details" in item:
-                    final_usage_details = item  # Capture usage details
-                    break  # Stop after getting usage
-                elif (
-                    hasattr(item, "choices")
-                    and item.choices
-                    and item.choices[0].delta
-                    and item.choices[0].delta.content
-                ):
-                    yield item.choices[0].delta.content
-                # else: logger.debug("Received non-content chunk in summary stream.")
+                # EAFP on the per-token path: only the final usage dict lacks
+                # `.choices`, so the type check runs once rather than per chunk
+                try:
+                    content = item.choices[0].delta.content
+                except AttributeError:
+                    if isinstance(item, dict) and "usage_details" in item:
+                        final_usage_details = item  # Capture usage details
+                        break  # Stop after getting usage
+                    continue
+                except IndexError:
+                    continue  # Chunk without choices (e.g. a usage-only chunk)
+                if content:
+                    yield content
 
             logger.debug("Summary stream finished.")
             # Yield final usage details
@@ -268,7 +447,7 @@ def generate_streaming_summary(
                 yield final_usage_details
             else:
                 logger.warning("Usage details not found in summary stream.")
-                yield {"usage_details": {"error": "Usage data missing from stream"}}
+                yield _MISSING_USAGE
 
         except Exception as e:
             logger.error("Error generating streaming research summary")
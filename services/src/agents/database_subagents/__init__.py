@@ -4,6 +4,11 @@ Database subagents module for AEGIS project.
 Contains specialized agents for database search and retrieval operations.
 """
 
-from .database_router import route_query_sync
+from .database_router import (
+    get_stage_name,
+    route_query,
+    route_query_many,
+    route_query_sync,
+)
 
-__all__ = ["route_query_sync"]
+__all__ = ["route_query_sync", "route_query", "route_query_many", "get_stage_name"]
@@ -6,28 +6,62 @@ This module handles routing database queries to the appropriate
 subagent modules. It serves as a central point for all database query routing.
 
 Functions:
-    route_query: Asynchronously routes a database query to the appropriate subagent
+    get_stage_name: Returns the process monitor stage name for a query worker
     route_query_sync: Synchronously routes a database query to the appropriate subagent
+    route_query: Asynchronously routes a database query to the appropriate subagent
+    route_query_many: Asynchronously routes a batch of database queries concurrently
 
 Dependencies:
     - asyncio (for async version)
+    - contextvars
+    - copy
+    - hashlib
     - logging
     - database subagent modules
     - typing (for type hints)
 """
 
 import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
 import importlib
 import inspect
 import logging
-from typing import Any, Dict, Generator, List, Optional, TypeVar, Union, cast, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+    Tuple,
+    TypedDict,
+)
 
 from ...initial_setup.env_config import config
-from ...global_prompts.database_statement import AVAILABLE_DATABASES
+from ...llm_connectors.llm_cache import LLMCache
+from ...global_prompts.database_statement import (
+    AVAILABLE_DATABASE_ID_SET,
+    AVAILABLE_DATABASES,
+)
 
 # Define response types for database queries
 MetadataResponse = List[Dict[str, Any]]
-ResearchResponse = Dict[str, str]
+
+
+class ResearchResponse(TypedDict):
+    """Research scope result returned by subagents."""
+
+    detailed_research: str
+    status_summary: str
+
+
 DatabaseResponse = Union[MetadataResponse, ResearchResponse]
 # Define the type returned by subagents (result + optional doc IDs + optional file links + optional page/section refs + optional section content + optional reference index)
 FileLink = Dict[str, str]  # Contains 'file_link' and 'document_name'
@@ -58,10 +92,320 @@ FINANCIAL_DATABASES = {
     "report_ir_quarterly_newsletter": "report_ir_quarterly_newsletter",
 }
 
+# Research response keys
+_DETAILED_KEY = "detailed_research"
+_STATUS_KEY = "status_summary"
+
+# Stage detail names for the optional elements of a SubagentResult, in order
+_RESULT_DETAIL_KEYS = (
+    "document_ids",
+    "file_links",
+    "page_section_refs",
+    "section_content_map",
+    "reference_index",
+)
+
+# Stage names used when the caller does not supply one
+_DEFAULT_STAGE_NAMES: Dict[str, str] = {
+    db: f"db_query_{db}_unknown" for db in AVAILABLE_DATABASES
+}
+
+# Positional calling convention of dispatch adapters
+_ADAPTER_PARAMS = (
+    "query",
+    "scope",
+    "token",
+    "process_monitor",
+    "query_stage_name",
+    "research_statement",
+)
+
+# Error message templates: the message is logged and reported to the process
+# monitor, the summary is shown to the user as the research status
+_UNKNOWN_DB_MSG = "Unknown database: {database}"
+_UNKNOWN_DB_SUMMARY = "❌ Error: Unknown database '{database}'."
+_IMPORT_FAILED_MSG = "Failed to import subagent module for '{database}'"
+_IMPORT_FAILED_SUMMARY = "❌ Error: Failed to load subagent for '{database}'."
+_MISSING_QUERY_FUNC_MSG = (
+    "Subagent module for '{database}' missing 'query_database_sync' function."
+)
+_NOT_CONFIGURED_MSG = "Database '{database}' is not configured in the router."
+_NOT_CONFIGURED_SUMMARY = "❌ Error: Unknown database type '{database}'."
+_BAD_TUPLE_LENGTH_MSG = "Unexpected tuple length {length} from subagent {database}"
+_BAD_FORMAT_DETAIL = "Error: Unexpected response format from {database}"
+_BAD_FORMAT_SUMMARY = "❌ Error: Invalid response format from '{database}'."
+_LOAD_FAILED_MSG = "Error loading/calling subagent for {database}"
+_LOAD_FAILED_SUMMARY = (
+    "❌ Error: Could not execute query for '{database}' due to internal configuration."
+)
+_EXECUTION_FAILED_MSG = "Error during query execution for {database} (scope: {scope})"
+_EXECUTION_FAILED_SUMMARY = "❌ Error: Failed during query execution for '{database}'."
+
+# Dispatch adapters keyed by database, filled lazily by _get_adapter
+_DISPATCH: Dict[str, Callable[..., Any]] = {}
+
+# Opt-in cache of subagent results keyed by database, scope and query. Entries
+# are shared across users and sessions, so it is disabled by default.
+_RESULT_CACHE: Optional[LLMCache] = (
+    LLMCache(
+        max_entries=config.DB_RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.DB_RESULT_CACHE_TTL_SECONDS,
+    )
+    if config.DB_RESULT_CACHE_ENABLED
+    else None
+)
+
 # Get module logger
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _supported_params(func: Callable) -> FrozenSet[str]:
+    """
+    Get the parameter names a subagent query function accepts.
+
+    The result never changes for a given function, so it is computed once
+    rather than calling inspect.signature on every routed query.
+
+    Args:
+        func (Callable): The subagent's query function.
+
+    Returns:
+        FrozenSet[str]: Names of the function's parameters.
+    """
+    signature = getattr(func, "__signature__", None) or inspect.signature(func)
+    return frozenset(signature.parameters)
+
+
+def _load_subagent(database: str) -> Tuple[Callable, FrozenSet[str]]:
+    """
+    Resolve a database's subagent query function and its parameter names.
+
+    Args:
+        database (str): The database identifier (a key of FINANCIAL_DATABASES).
+
+    Returns:
+        Tuple[Callable, FrozenSet[str]]: The subagent's query_database_sync
+            function and the names of the parameters it accepts.
+
+    Raises:
+        ImportError: If the subagent module cannot be imported.
+        AttributeError: If the subagent module lacks 'query_database_sync'.
+    """
+    module_path = (
+        f"services.src.agents.database_subagents.{FINANCIAL_DATABASES[database]}.subagent"
+    )
+    subagent_module = importlib.import_module(module_path)
+    logger.debug("Successfully imported module: %s", module_path)
+
+    query_func = getattr(subagent_module, "query_database_sync", None)
+    if query_func is None:
+        raise AttributeError(
+            _MISSING_QUERY_FUNC_MSG.format(database=database)
+        )
+    return query_func, _supported_params(query_func)
+
+
+def _build_adapter(query_func: Callable, params: FrozenSet[str]) -> Callable[..., Any]:
+    """
+    Bind a subagent query function into a uniform dispatch callable.
+
+    Which optional arguments the subagent accepts is decided here, once,
+    instead of on every routed query. A subagent whose signature matches the
+    adapter calling convention exactly is used as its own adapter.
+
+    Args:
+        query_func (Callable): The subagent's query_database_sync function.
+        params (FrozenSet[str]): Names of the parameters query_func accepts.
+
+    Returns:
+        Callable[..., Any]: Adapter called as
+            adapter(query, scope, token, process_monitor, stage_name, research_statement).
+    """
+    signature = getattr(query_func, "__signature__", None) or inspect.signature(query_func)
+    if tuple(signature.parameters) == _ADAPTER_PARAMS and all(
+        parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        for parameter in signature.parameters.values()
+    ):
+        return query_func
+
+    pass_monitor = "process_monitor" in params
+    pass_stage_name = "query_stage_name" in params
+    pass_research_statement = "research_statement" in params
+
+    # Subagents accepting all or none of the optional arguments get a direct call
+    if pass_monitor and pass_stage_name and pass_research_statement:
+
+        def _adapter(query, scope, token, process_monitor, stage_name, research_statement):
+            return query_func(
+                query=query,
+                scope=scope,
+                token=token,
+                process_monitor=process_monitor,
+                query_stage_name=stage_name,
+                research_statement=research_statement,
+            )
+
+    elif not (pass_monitor or pass_stage_name or pass_research_statement):
+
+        def _adapter(query, scope, token, process_monitor, stage_name, research_statement):
+            return query_func(query=query, scope=scope, token=token)
+
+    else:
+
+        def _adapter(query, scope, token, process_monitor, stage_name, research_statement):
+            call_args = {"query": query, "scope": scope, "token": token}
+            if pass_monitor:
+                call_args["process_monitor"] = process_monitor
+            if pass_stage_name:
+                call_args["query_stage_name"] = stage_name
+            if pass_research_statement:
+                call_args["research_statement"] = research_statement
+            return query_func(**call_args)
+
+    return _adapter
+
+
+def _get_adapter(database: str) -> Callable[..., Any]:
+    """
+    Look up a database's dispatch adapter, building it on first use.
+
+    Failures are not cached, so a subagent that failed to import is retried
+    on the next query.
+
+    Args:
+        database (str): The database identifier (a key of FINANCIAL_DATABASES).
+
+    Returns:
+        Callable[..., Any]: The database's adapter (see _build_adapter).
+
+    Raises:
+        ImportError: If the subagent module cannot be imported.
+        AttributeError: If the subagent module lacks 'query_database_sync'.
+    """
+    adapter = _DISPATCH.get(database)
+    if adapter is None:
+        adapter = _DISPATCH[database] = _build_adapter(*_load_subagent(database))
+    return adapter
+
+
+@functools.lru_cache(maxsize=256)
+def get_stage_name(database: str, worker_id: int) -> str:
+    """
+    Get the process monitor stage name for one query worker.
+
+    There are only as many names as databases times worker IDs, so each is
+    formatted once and the same string object is reused as the stage key.
+
+    Args:
+        database (str): The database identifier.
+        worker_id (int): Index of the query within its batch.
+
+    Returns:
+        str: Stage name of the form 'db_query_<database>_<worker_id>'.
+    """
+    return f"db_query_{database}_{worker_id}"
+
+
+def _result_cache_key(
+    database: str, scope: str, query: str, research_statement: Optional[str]
+) -> str:
+    """
+    Build the result cache key for a query.
+
+    Args:
+        database (str): The database identifier.
+        scope (str): The scope of the query ('metadata' or 'research').
+        query (str): The search query.
+        research_statement (str, optional): Research statement passed to the subagent.
+
+    Returns:
+        str: Hex BLAKE2b digest identifying the query.
+    """
+    raw = "\x1f".join((database, scope, query, research_statement or ""))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _is_error_response(response: DatabaseResponse) -> bool:
+    """
+    Check whether a subagent response reports an error.
+
+    Subagents catch their own exceptions and return an ordinary result tuple
+    whose research response describes the error; such results must not be
+    cached.
+
+    Args:
+        response (DatabaseResponse): First element of a subagent result tuple.
+
+    Returns:
+        bool: True if the response is a research error response.
+    """
+    if not isinstance(response, dict):
+        return False
+    return str(response.get(_DETAILED_KEY, "")).startswith("Error:") or str(
+        response.get(_STATUS_KEY, "")
+    ).startswith("❌")
+
+
+def _error_tuple(scope: str, detail: str, summary: str) -> SubagentResult:
+    """
+    Build the result tuple for a failed query.
+
+    Args:
+        scope (str): The scope of the query ('metadata' or 'research').
+        detail (str): Detailed research text describing the error.
+        summary (str): Status summary shown to the user.
+
+    Returns:
+        SubagentResult: An empty list for 'metadata' scope or a research response
+            with the detail and summary, with None for all other tuple elements.
+    """
+    if scope == "metadata":
+        return ([], None, None, None, None, None)
+    return ({_DETAILED_KEY: detail, _STATUS_KEY: summary}, None, None, None, None, None)
+
+
+def _emit_error(
+    stage_name: str,
+    process_monitor,
+    scope: str,
+    error_msg: str,
+    status_summary: str,
+    detailed_research: Optional[str] = None,
+    exc: Optional[BaseException] = None,
+) -> SubagentResult:
+    """
+    Log a routing error, report it to the process monitor and build its result.
+
+    The exception, if any, is logged by message only; its traceback is logged
+    at debug level, so it is only formatted when debug logging is enabled.
+
+    Args:
+        stage_name (str): Stage the error is reported against.
+        process_monitor (optional): Process monitor instance, if any.
+        scope (str): The scope of the query ('metadata' or 'research').
+        error_msg (str): Message logged and reported to the process monitor.
+        status_summary (str): Status summary shown to the user for research scope.
+        detailed_research (str, optional): Detailed research text for research
+            scope. Defaults to the error message.
+        exc (BaseException, optional): The exception that caused the error.
+
+    Returns:
+        SubagentResult: An empty list for 'metadata' scope or a research response
+            describing the error, with None for all other tuple elements.
+    """
+    if exc is None:
+        logger.error(error_msg)
+    else:
+        logger.error("%s: %s", error_msg, exc)
+        logger.debug("Traceback for %s", stage_name, exc_info=exc)
+    if process_monitor:
+        process_monitor.add_stage_details(stage_name, error=error_msg)
+    return _error_tuple(
+        scope, detailed_research or f"Error: {error_msg}", status_summary
+    )
+
+
 def route_query_sync(
     database: str,
     query: str,
@@ -96,107 +440,71 @@ def route_query_sync(
         ValueError: If the database is not recognized or subagent is invalid.
         AttributeError: If the subagent module lacks 'query_database_sync'.
     """
-    logger.info(f"Routing query (sync) to database: {database} with scope: {scope}")
-    stage_name = query_stage_name or f"db_query_{database}_unknown"
-
-    if database not in AVAILABLE_DATABASES:
-        error_msg = f"Unknown database: {database}"
-        logger.error(error_msg)
-        # Return appropriate error type based on expected scope return type
-        if scope == "metadata":
-            error_response: DatabaseResponse = []
-        else:  # research scope
-            error_response: DatabaseResponse = {
-                "detailed_research": f"Error: {error_msg}",
-                "status_summary": f"❌ Error: Unknown database '{database}'.",
-            }
-
-        if process_monitor:
-            process_monitor.add_stage_details(stage_name, error=error_msg)
-
-        return (
-            error_response,
-            None,
-            None,
-            None,
-            None,
-            None,
-        )  # Return tuple with None for file_links, page_refs, section_content, reference_index
+    logger.info("Routing query (sync) to database: %s with scope: %s", database, scope)
+    stage_name = (
+        query_stage_name
+        or _DEFAULT_STAGE_NAMES.get(database)
+        or f"db_query_{database}_unknown"
+    )
+
+    if database not in AVAILABLE_DATABASE_ID_SET:
+        return _emit_error(
+            stage_name,
+            process_monitor,
+            scope,
+            _UNKNOWN_DB_MSG.format(database=database),
+            _UNKNOWN_DB_SUMMARY.format(database=database),
+        )
 
     try:
+        # Serve repeated queries from the result cache when it is enabled
+        cache_key = None
+        if _RESULT_CACHE is not None:
+            cache_key = _result_cache_key(database, scope, query, research_statement)
+            cached_result = _RESULT_CACHE.get(cache_key)
+            if cached_result is not None:
+                logger.info("Result cache hit for %s", database)
+                if process_monitor:
+                    process_monitor.add_stage_details(stage_name, cache_hit=True)
+                # Each caller gets its own copy of the cached containers
+                return copy.deepcopy(cached_result)
+
         # Check if this is a financial database
         if database in FINANCIAL_DATABASES:
-            # Get the folder name from the mapping
-            subagent_folder = FINANCIAL_DATABASES[database]
-            # Use dynamic import for the specific financial database subagent
-            module_path = f"services.src.agents.database_subagents.{subagent_folder}.subagent"
             try:
-                subagent_module = importlib.import_module(module_path)
-                logger.debug(f"Successfully imported module: {module_path}")
+                adapter = _get_adapter(database)
             except ImportError as e:
-                error_msg = f"Failed to import subagent module for '{database}'"
-                logger.error(error_msg)
-                
-                if process_monitor:
-                    process_monitor.add_stage_details(stage_name, error=error_msg)
-                
-                # Return appropriate error response
-                if scope == "metadata":
-                    error_response: DatabaseResponse = []
-                else:
-                    error_response: DatabaseResponse = {
-                        "detailed_research": f"Error: {error_msg}",
-                        "status_summary": f"❌ Error: Failed to load subagent for '{database}'.",
-                    }
-                return (error_response, None, None, None, None, None)
-
-            if not hasattr(subagent_module, "query_database_sync"):
-                error_msg = f"Subagent module for '{database}' missing 'query_database_sync' function."
-                logger.error(error_msg)
-
-                if process_monitor:
-                    process_monitor.add_stage_details(stage_name, error=error_msg)
-
-                # Raise attribute error as it's a code structure issue
-                raise AttributeError(error_msg)
-
-            # Use the synchronous version directly
-            query_func = subagent_module.query_database_sync
-            logger.info(f"Calling query_database_sync for {database}")
+                return _emit_error(
+                    stage_name,
+                    process_monitor,
+                    scope,
+                    _IMPORT_FAILED_MSG.format(database=database),
+                    _IMPORT_FAILED_SUMMARY.format(database=database),
+                    exc=e,
+                )
 
-            # Check if the function can accept process_monitor and query_stage_name parameters
-            sig = inspect.signature(query_func)
-            call_args = {"query": query, "scope": scope, "token": token}
-            if "process_monitor" in sig.parameters:
-                call_args["process_monitor"] = process_monitor
-            if "query_stage_name" in sig.parameters:
-                call_args["query_stage_name"] = stage_name
-            if "research_statement" in sig.parameters:
-                call_args["research_statement"] = research_statement
+            logger.info("Calling query_database_sync for %s", database)
 
             # Call the subagent
-            result_tuple = query_func(**call_args)
+            result_tuple = adapter(
+                query, scope, token, process_monitor, stage_name, research_statement
+            )
         else:
             # Unknown database type
-            error_msg = f"Database '{database}' is not configured in the router."
-            logger.error(error_msg)
-            
-            if process_monitor:
-                process_monitor.add_stage_details(stage_name, error=error_msg)
-            
-            # Return appropriate error response
-            if scope == "metadata":
-                error_response: DatabaseResponse = []
-            else:
-                error_response: DatabaseResponse = {
-                    "detailed_research": f"Error: {error_msg}",
-                    "status_summary": f"❌ Error: Unknown database type '{database}'.",
-                }
-            return (error_response, None, None, None, None, None)
-
-        logger.info(
-            f"Subagent {database} returned tuple with {len(result_tuple) if hasattr(result_tuple, '__len__') else 'unknown'} elements"
-        )
+            return _emit_error(
+                stage_name,
+                process_monitor,
+                scope,
+                _NOT_CONFIGURED_MSG.format(database=database),
+                _NOT_CONFIGURED_SUMMARY.format(database=database),
+            )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Subagent %s returned tuple with %s elements",
+                database,
+                len(result_tuple) if hasattr(result_tuple, "__len__") else "unknown",
+            )
 
         # Handle different tuple lengths for backward compatibility
         if len(result_tuple) == 2:
@@ -238,116 +546,186 @@ def route_query_sync(
             pass
         else:
             # Unexpected tuple length - log error and create safe 6-element tuple
-            error_msg = (
-                f"Unexpected tuple length {len(result_tuple)} from subagent {database}"
+            cache_key = None  # Never cache error responses
+            result_tuple = _emit_error(
+                stage_name,
+                process_monitor,
+                scope,
+                _BAD_TUPLE_LENGTH_MSG.format(length=len(result_tuple), database=database),
+                _BAD_FORMAT_SUMMARY.format(database=database),
+                detailed_research=_BAD_FORMAT_DETAIL.format(database=database),
             )
-            logger.error(error_msg)
-            if process_monitor:
-                process_monitor.add_stage_details(stage_name, error=error_msg)
-            # Create error response tuple
-            if scope == "metadata":
-                error_response: DatabaseResponse = []
-            else:
-                error_response: DatabaseResponse = {
-                    "detailed_research": f"Error: Unexpected response format from {database}",
-                    "status_summary": f"❌ Error: Invalid response format from '{database}'.",
-                }
-            result_tuple = (error_response, None, None, None, None, None)
 
         # Now result_tuple is guaranteed to have 6 elements
         # The following line was incorrectly indented after removing the else block
 
         # End the stage successfully if process monitor is provided
         if process_monitor:
-            # If the subagent didn't add document IDs to the stage details, add them now
-            if len(result_tuple) > 1 and result_tuple[1]:  # If doc_ids is not None
-                process_monitor.add_stage_details(
-                    stage_name, document_ids=result_tuple[1]
-                )
-            # Add file links if available
-            if len(result_tuple) > 2 and result_tuple[2]:  # If file_links is not None
-                process_monitor.add_stage_details(
-                    stage_name, file_links=result_tuple[2]
-                )
-            # Add page/section refs if available
-            if (
-                len(result_tuple) > 3 and result_tuple[3]
-            ):  # If page_section_refs is not None
-                process_monitor.add_stage_details(
-                    stage_name, page_section_refs=result_tuple[3]
-                )
-            # Add section content if available
-            if (
-                len(result_tuple) > 4 and result_tuple[4]
-            ):  # If section_content_map is not None
-                process_monitor.add_stage_details(
-                    stage_name, section_content_map=result_tuple[4]
-                )
-            # Add reference index if available
-            if (
-                len(result_tuple) > 5 and result_tuple[5]
-            ):  # If reference_index is not None
-                process_monitor.add_stage_details(
-                    stage_name, reference_index=result_tuple[5]
-                )
-
-            # Add status summary if available in research results
+            # Report everything the subagent returned in a single update
+            result_details = {
+                key: value
+                for key, value in zip(_RESULT_DETAIL_KEYS, result_tuple[1:])
+                if value
+            }
             if scope == "research" and isinstance(result_tuple[0], dict):
-                status_summary = result_tuple[0].get("status_summary", "")
+                status_summary = result_tuple[0].get(_STATUS_KEY)
                 if status_summary:
-                    process_monitor.add_stage_details(
-                        stage_name, status_summary=status_summary
-                    )
+                    result_details["status_summary"] = status_summary
+            if result_details:
+                process_monitor.add_stage_details(stage_name, **result_details)
+
+        if cache_key is not None and not _is_error_response(result_tuple[0]):
+            _RESULT_CACHE.set(cache_key, copy.deepcopy(result_tuple))
 
         # Return the complete tuple (result, doc_ids, file_links, page_section_refs, section_content_map, reference_index)
         return result_tuple
 
-    except (ImportError, AttributeError) as e:
-        # Handle errors related to module loading or function signature
-        error_msg = f"Error loading/calling subagent for {database}"
-        logger.error(error_msg)
-        if scope == "metadata":
-            error_response: DatabaseResponse = []
-        else:  # research scope
-            error_response: DatabaseResponse = {
-                "detailed_research": f"Error: {error_msg}",
-                "status_summary": f"❌ Error: Could not execute query for '{database}' due to internal configuration.",
-            }
+    except Exception as e:
+        if isinstance(e, (ImportError, AttributeError)):
+            # Errors related to module loading or function signature
+            error_msg = _LOAD_FAILED_MSG.format(database=database)
+            status_summary = _LOAD_FAILED_SUMMARY.format(database=database)
+        else:
+            # Other exceptions during subagent execution
+            error_msg = _EXECUTION_FAILED_MSG.format(database=database, scope=scope)
+            status_summary = _EXECUTION_FAILED_SUMMARY.format(database=database)
+        return _emit_error(
+            stage_name, process_monitor, scope, error_msg, status_summary, exc=e
+        )
 
-        if process_monitor:
-            process_monitor.add_stage_details(stage_name, error=error_msg)
 
-        return (
-            error_response,
-            None,
-            None,
-            None,
-            None,
-            None,
-        )  # Return tuple with None for file_links, page_refs, section_content, reference_index
+async def route_query(
+    database: str,
+    query: str,
+    scope: str,
+    token: Optional[str] = None,
+    process_monitor=None,
+    query_stage_name: Optional[str] = None,
+    research_statement: Optional[str] = None,
+) -> SubagentResult:
+    """
+    Asynchronously routes a database query to the appropriate subagent module.
+
+    Subagents are synchronous, so the query runs route_query_sync on the event
+    loop's default executor, with the caller's context variables, and the
+    caller awaits it without blocking the loop.
 
-    except Exception as e:
-        # Catch other potential exceptions during subagent execution
-        error_msg = (
-            f"Error during query execution for {database} (scope: {scope})"
+    Args:
+        database (str): The database identifier.
+        query (str): The search query to execute.
+        scope (str): The scope of the query ('metadata' or 'research').
+        token (str, optional): Authentication token for API access.
+        process_monitor (optional): Process monitor instance for tracking token usage.
+        query_stage_name (str, optional): The specific stage name for this query instance.
+        research_statement (str, optional): Research statement for similarity-based filtering.
+
+    Returns:
+        SubagentResult: The same result tuple route_query_sync returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            contextvars.copy_context().run,
+            route_query_sync,
+            database,
+            query,
+            scope,
+            token,
+            process_monitor,
+            query_stage_name,
+            research_statement,
+        ),
+    )
+
+
+async def route_query_many(
+    requests: List[Tuple[str, str, str, Optional[str]]],
+    token: Optional[str] = None,
+    process_monitor=None,
+    stage_names: Optional[List[str]] = None,
+) -> List[SubagentResult]:
+    """
+    Asynchronously routes a batch of database queries, running them concurrently.
+
+    Each query is dispatched with route_query under its own process monitor
+    stage, which is started before the query and ended with 'completed' or
+    'error' once it finishes. The batch is awaited with asyncio.gather; a query
+    that raises is converted into the same error tuple route_query_sync
+    returns, so one failure does not fail the batch.
+
+    Args:
+        requests (List[Tuple[str, str, str, Optional[str]]]): (database, query,
+            scope, research_statement) for each query. The research statement
+            is passed to the subagent for similarity filtering and may be None.
+        token (str, optional): Authentication token for API access.
+        process_monitor (optional): Process monitor instance for tracking token usage.
+        stage_names (List[str], optional): Stage name for each request. Defaults
+            to 'db_batch_query_<database>_<index>', which does not collide with
+            the stage names of the query workers (see get_stage_name).
+
+    Returns:
+        List[SubagentResult]: One result tuple per request, in request order.
+
+    Raises:
+        ValueError: If stage_names does not have one name per request.
+    """
+    if stage_names is None:
+        stage_names = [
+            f"db_batch_query_{request[0]}_{index}" for index, request in enumerate(requests)
+        ]
+    elif len(stage_names) != len(requests):
+        raise ValueError(
+            f"Expected {len(requests)} stage names, got {len(stage_names)}"
         )
-        logger.error(error_msg)
-        if scope == "metadata":
-            error_response: DatabaseResponse = []
-        else:  # research scope
-            error_response: DatabaseResponse = {
-                "detailed_research": f"Error: {error_msg}",
-                "status_summary": f"❌ Error: Failed during query execution for '{database}'.",
-            }
 
+    async def _run(
+        request: Tuple[str, str, str, Optional[str]], index: int, stage_name: str
+    ) -> SubagentResult:
+        database, query, scope, research_statement = request
+        if process_monitor:
+            process_monitor.start_stage(stage_name)
+            process_monitor.add_stage_details(
+                stage_name,
+                db_name=database,
+                query_text=query,
+                scope=scope,
+                query_index=index,
+                total_queries=len(requests),
+            )
+        try:
+            result = await route_query(
+                database,
+                query,
+                scope,
+                token,
+                process_monitor,
+                stage_name,
+                research_statement,
+            )
+        except Exception as e:
+            result = _emit_error(
+                stage_name,
+                process_monitor,
+                scope,
+                _EXECUTION_FAILED_MSG.format(database=database, scope=scope),
+                _EXECUTION_FAILED_SUMMARY.format(database=database),
+                exc=e,
+            )
+            if process_monitor:
+                process_monitor.end_stage(stage_name, "error")
+            return result
         if process_monitor:
-            process_monitor.add_stage_details(stage_name, error=error_msg)
-
-        return (
-            error_response,
-            None,
-            None,
-            None,
-            None,
-            None,
-        )  # Return tuple with None for file_links, page_refs, section_content, reference_index
+            process_monitor.end_stage(
+                stage_name, "error" if _is_error_response(result[0]) else "completed"
+            )
+        return result
+
+    return list(
+        await asyncio.gather(
+            *(
+                _run(request, index, stage_name)
+                for index, (request, stage_name) in enumerate(zip(requests, stage_names))
+            )
+        )
+    )
@@ -0,0 +1,153 @@
+# services/src/agents/database_subagents/subagent_benchmarking/bench_data.py
+"""
+Benchmarking Placeholder Data
+
+Static demo data returned by the PLACEHOLDER benchmarking subagent. Kept in
+its own module so the literals are compiled once and built once at import,
+rather than rebuilt on every query. The real implementation will read this
+data from the benchmarking database and this module can then be removed.
+
+Dependencies:
+    - typing (for type hints)
+"""
+
+from typing import Any, Dict, List
+
+# PLACEHOLDER: Sample available financial metrics
+METRIC_CATALOG: List[Dict[str, Any]] = [
+    {
+        "metric_id": "net_income_q3_2024",
+        "metric_name": "Net Income",
+        "banks_available": ["RBC", "TD", "BMO", "Scotiabank", "CIBC", "JPM", "BAC", "WFC"],
+        "periods_available": ["Q1 2024", "Q2 2024", "Q3 2024"],
+        "data_type": "Income Statement",
+        "currency": "CAD/USD (by bank)",
+        "granularity": "Quarterly",
+        "historical_depth": "10 years",
+        "last_updated": "2024-08-25"
+    },
+    {
+        "metric_id": "roe_quarterly_2024",
+        "metric_name": "Return on Equity (ROE)", 
+        "banks_available": ["RBC", "TD", "BMO", "Scotiabank", "CIBC", "JPM", "BAC", "WFC"],
+        "periods_available": ["Q1 2024", "Q2 2024", "Q3 2024"],
+        "data_type": "Calculated Ratio",
+        "currency": "Percentage",
+        "granularity": "Quarterly", 
+        "historical_depth": "10 years",
+        "calculation": "Net Income / Average Shareholders' Equity",
+        "last_updated": "2024-08-25"
+    },
+    {
+        "metric_id": "cet1_ratio_q3_2024",
+        "metric_name": "Common Equity Tier 1 (CET1) Ratio",
+        "banks_available": ["RBC", "TD", "BMO", "Scotiabank", "CIBC", "JPM", "BAC", "WFC"],
+        "periods_available": ["Q1 2024", "Q2 2024", "Q3 2024"],
+        "data_type": "Balance Sheet / Regulatory",
+        "currency": "Percentage",
+        "granularity": "Quarterly",
+        "historical_depth": "8 years",
+        "regulatory_requirement": "OSFI/Fed minimum 4.5%",
+        "last_updated": "2024-08-25"
+    }
+]
+
+# PLACEHOLDER: Research analysis template, filled with the query
+RESEARCH_TEMPLATE = """
+## Financial Benchmarking Analysis
+
+Based on query: "{query}" - Analysis from the primary financial metrics database:
+
+### Quantitative Results
+
+**Net Income - Q3 2024 (CAD Billions)**:
+- Royal Bank of Canada: $4.2B (+8% YoY, +3% QoQ)
+- TD Bank: $3.8B (+5% YoY, -1% QoQ)  
+- Bank of Montreal: $2.1B (+12% YoY, +7% QoQ)
+- Scotiabank: $2.3B (+6% YoY, +2% QoQ)
+- CIBC: $1.9B (+9% YoY, +4% QoQ)
+
+**Return on Equity (ROE) - Q3 2024**:
+- Royal Bank of Canada: 16.2% (vs 15.8% Q2, 15.1% Q3 2023)
+- TD Bank: 14.7% (vs 15.1% Q2, 14.2% Q3 2023)
+- Bank of Montreal: 15.9% (vs 14.8% Q2, 14.3% Q3 2023)
+- Scotiabank: 13.8% (vs 13.5% Q2, 13.2% Q3 2023)
+- CIBC: 15.4% (vs 14.9% Q2, 14.6% Q3 2023)
+
+**Capital Ratios - CET1 Q3 2024**:
+- Royal Bank of Canada: 16.1% (well above 4.5% minimum)
+- TD Bank: 15.8% (well above 4.5% minimum)
+- Bank of Montreal: 15.2% (well above 4.5% minimum)
+- Scotiabank: 14.9% (well above 4.5% minimum)  
+- CIBC: 15.7% (well above 4.5% minimum)
+
+### Comparative Analysis
+
+**Peer Ranking by Net Income (Q3 2024)**:
+1. RBC: $4.2B (Market Leader)
+2. TD: $3.8B (-9% vs RBC)
+3. Scotiabank: $2.3B (-45% vs RBC)
+4. BMO: $2.1B (-50% vs RBC)
+5. CIBC: $1.9B (-55% vs RBC)
+
+**Performance Trends**:
+- All Big 5 Canadian banks showing positive YoY growth
+- BMO leading YoY growth at +12%, driven by US acquisition integration
+- TD showing modest sequential decline due to provisions
+- Capital ratios remain strong across all institutions
+
+### Historical Context (5-Year Trends)
+
+- Average ROE for Big 5: 15.0% (Q3 2024) vs 13.8% (Q3 2019)
+- Net income growth CAGR (2019-2024): RBC 7.2%, TD 5.8%, BMO 9.1%
+- Capital ratios have strengthened post-pandemic, averaging 15.5% vs 13.2% in 2019
+
+**Note**: This analysis uses PLACEHOLDER data. The actual implementation will query real financial metrics from PostgreSQL tables and provide exact figures, calculations, and comprehensive benchmarking analysis based on your specific requirements.
+
+---
+*Source: Financial Benchmarking Database - Primary source for all financial line items and metrics*
+"""
+
+RESEARCH_STATUS_SUMMARY = "✅ PLACEHOLDER: Analyzed financial benchmarking data and provided quantitative metrics with peer comparisons"
+
+# PLACEHOLDER: Sample data identifiers returned with every response
+SAMPLE_DOC_IDS = ["benchmark_q3_2024_001", "benchmark_historical_002", "benchmark_ratios_003"]
+
+SAMPLE_FILE_LINKS = [
+    {"file_link": "/benchmarking/q3_2024_metrics.xlsx", "document_name": "Q3 2024 Financial Metrics"},
+    {"file_link": "/benchmarking/historical_trends.xlsx", "document_name": "Historical Trend Analysis"}
+]
+
+SAMPLE_PAGE_REFS = {
+    1: [1, 2],     # Income statement metrics
+    2: [1, 3],     # Balance sheet data
+    3: [2, 4],     # Calculated ratios
+    4: [1]         # Historical comparisons
+}
+
+SAMPLE_SECTION_CONTENT = {
+    "1:1": "Net income by bank and quarter with YoY/QoQ changes",
+    "1:2": "Revenue breakdown and key income statement components",
+    "2:1": "Balance sheet totals and key asset categories",
+    "2:3": "Regulatory capital components and calculations",
+    "3:2": "Return ratios (ROE, ROA, ROTE) by institution",
+    "3:4": "Efficiency ratios and operational metrics",
+    "4:1": "5-year historical trend analysis and CAGR calculations"
+}
+
+SAMPLE_REFERENCE_INDEX = {
+    "REF005": {
+        "doc_name": "Q3 2024 Financial Benchmarking Dataset",
+        "page": 1,
+        "section": "Income Statement Metrics",
+        "data_source": "Regulatory filings and investor presentations",
+        "calculation_method": "Standardized GAAP/IFRS"
+    },
+    "REF006": {
+        "doc_name": "Historical Trend Analysis",
+        "page": 4,
+        "section": "5-Year Performance Trends",
+        "data_source": "Consolidated regulatory data",
+        "time_period": "Q3 2019 - Q3 2024"
+    }
+}
@@ -20,6 +20,7 @@ Dependencies:
 
 import inspect
 import concurrent.futures
+import contextvars
 import json
 import logging
 import time
@@ -33,10 +34,11 @@ from ..global_prompts.database_statement import get_available_databases
 # Import the connector, but not the removed usage functions
 from ..llm_connectors.rbc_openai import (
     call_llm,
+    start_roundtrip_tracking,
 )  # Assuming this is the correct import now
 
 # Import sync version of route_query
-from ..agents.database_subagents.database_router import route_query_sync
+from ..agents.database_subagents.database_router import get_stage_name, route_query_sync
 
 # Import config for global access
 from ..initial_setup.env_config import config
@@ -610,7 +612,7 @@ def _execute_query_worker(
     from ..initial_setup.process_monitor_setup import get_process_monitor
 
     process_monitor = get_process_monitor()
-    query_stage_name = f"db_query_{db_name}_{query_index}"
+    query_stage_name = get_stage_name(db_name, query_index)
 
     process_monitor.start_stage(query_stage_name)
     process_monitor.add_stage_details(
@@ -696,10 +698,10 @@ def _execute_query_worker(
         # End the stage for this specific query worker instance successfully
         process_monitor.end_stage(query_stage_name)  # RESTORED end_stage call here
 
-        # Add result details
+        # Add result details and document IDs in a single update
+        result_details = {}
         if scope == "metadata" and isinstance(result, list):
-            process_monitor.add_stage_details(
-                query_stage_name,
+            result_details.update(
                 result_count=len(result),
                 document_names=[
                     item.get("document_name", "Unnamed") for item in result[:10]
@@ -707,14 +709,14 @@ def _execute_query_worker(
                 has_more_documents=len(result) > 10,
             )
         elif scope == "research" and isinstance(result, dict):
-            process_monitor.add_stage_details(
-                query_stage_name,
+            result_details.update(
                 status_summary=result.get("status_summary", "No status provided"),
                 has_detailed_research=bool(result.get("detailed_research")),
             )
-        # Add document IDs to details if they were returned
         if doc_ids is not None:  # Check if doc_ids is not None (could be empty list)
-            process_monitor.add_stage_details(query_stage_name, document_ids=doc_ids)
+            result_details["document_ids"] = doc_ids
+        if result_details:
+            process_monitor.add_stage_details(query_stage_name, **result_details)
 
     except Exception as e:
         task_exception = e
@@ -784,6 +786,9 @@ def _model_generator(
     process_monitor.start_monitoring()
     logger.info(f"Started monitoring. Start time: {process_monitor.start_time}")
 
+    # Count LLM round-trips for this run (logged in the finally block)
+    llm_roundtrips = start_roundtrip_tracking()
+
     # Initialize legacy debug tracking (structure might be inaccurate now)
     debug_data = None
     if debug_mode:
@@ -1085,7 +1090,9 @@ def _model_generator(
                             )
                             if i > 0:
                                 time.sleep(1)
+                            # Run in a copy of this context so round-trips are counted
                             future = executor.submit(
+                                contextvars.copy_context().run,
                                 _execute_query_worker,
                                 db_name,
                                 query_text,
@@ -1408,7 +1415,6 @@ def _model_generator(
                                 aggregated_detailed_research,
                                 scope,
                                 token,
-                                available_databases,
                                 research_statement=research_statement,
                                 reference_index=master_reference_index,
                             )
@@ -1535,6 +1541,11 @@ def _model_generator(
             )
             process_monitor.end_monitoring()
 
+        logger.info(
+            f"LLM round-trips for run {run_uuid_val}: "
+            f"{sum(llm_roundtrips.values())} {llm_roundtrips}"
+        )
+
         # --- Database Logging Call ---
         if process_monitor.enabled:
             try:
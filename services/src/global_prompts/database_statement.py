@@ -7,6 +7,7 @@ This module serves as the single source of truth for database information across
 """
 
 import logging
+from typing import FrozenSet, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -71,12 +72,22 @@ AVAILABLE_DATABASES = {
     },
 }
 
+# Frozen database IDs: a tuple preserves declaration order for tool enums,
+# a frozenset serves membership checks
+AVAILABLE_DATABASE_IDS: Tuple[str, ...] = tuple(AVAILABLE_DATABASES)
+AVAILABLE_DATABASE_ID_SET: FrozenSet[str] = frozenset(AVAILABLE_DATABASES)
 
-def get_database_statement() -> str:
+
+def get_database_statement(include_timestamp: bool = True) -> str:
     """
     Generate the database availability statement with XML-style delimiters.
     This function provides the complete database configuration for system prompts.
 
+    Args:
+        include_timestamp: Whether to stamp the statement with the current time.
+            Pass False for prompts that must stay byte-identical between calls
+            (provider prefix caching).
+
     Returns:
         str: Formatted database statement
     """
@@ -98,7 +109,9 @@ def get_database_statement() -> str:
 </DATABASE>"""
             db_list.append(db_entry)
 
-        statement = f"""<AVAILABLE_DATABASES timestamp="{current_time}">
+        timestamp_attr = f' timestamp="{current_time}"' if include_timestamp else ""
+
+        statement = f"""<AVAILABLE_DATABASES{timestamp_attr}>
 The following databases are available for research:
 {"".join(db_list)}
 
@@ -129,13 +142,16 @@ def get_available_databases() -> dict:
     return AVAILABLE_DATABASES
 
 
-def get_filtered_database_statement(available_databases: dict) -> str:
+def get_filtered_database_statement(
+    available_databases: dict, include_timestamp: bool = True
+) -> str:
     """
     Generate a filtered database statement based on the databases available to the current user.
     This is used by the Planner agent which receives a filtered list of databases.
 
     Args:
         available_databases: Dict of database keys and info available to the user
+        include_timestamp: Whether to stamp the statement with the current time
 
     Returns:
         str: Formatted filtered database statement
@@ -143,7 +159,7 @@ def get_filtered_database_statement(available_databases: dict) -> str:
     # Input validation
     if not isinstance(available_databases, dict):
         logger.warning("Invalid input: available_databases must be a dictionary")
-        return get_database_statement()
+        return get_database_statement(include_timestamp)
     
     try:
         from datetime import datetime, timezone
@@ -153,7 +169,7 @@ def get_filtered_database_statement(available_databases: dict) -> str:
         # Build the filtered database listing
         db_list = []
         for db_key, db_info in available_databases.items():
-            if db_key in AVAILABLE_DATABASES:
+            if db_key in AVAILABLE_DATABASE_ID_SET:
                 full_info = AVAILABLE_DATABASES[db_key]
                 db_entry = f"""
 <DATABASE id="{db_key}">
@@ -165,7 +181,9 @@ def get_filtered_database_statement(available_databases: dict) -> str:
 </DATABASE>"""
                 db_list.append(db_entry)
 
-        statement = f"""<AVAILABLE_DATABASES timestamp="{current_time}" filtered="true">
+        timestamp_attr = f' timestamp="{current_time}"' if include_timestamp else ""
+
+        statement = f"""<AVAILABLE_DATABASES{timestamp_attr} filtered="true">
 The following databases are available for your research based on your access permissions:
 {"".join(db_list)}
 
@@ -183,4 +201,4 @@ For optimal results:
     except Exception as e:
         logger.debug("Error generating filtered database statement")
         # Fallback to full statement if filtering fails
-        return get_database_statement()
\ No newline at end of file
+        return get_database_statement(include_timestamp)
\ No newline at end of file
@@ -6,21 +6,26 @@ Generates a fiscal context statement based on the current date.
 Fiscal year runs from November 1 to October 31.
 """
 
+import functools
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Tuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def get_fiscal_period() -> Tuple[int, int]:
+def get_fiscal_period(current_date: Optional[date] = None) -> Tuple[int, int]:
     """
     Calculate current fiscal year and quarter.
 
+    Args:
+        current_date (date, optional): Date to calculate for; defaults to today (UTC)
+
     Returns:
         Tuple[int, int]: Fiscal year and quarter
     """
-    current_date = datetime.now(timezone.utc)
+    if current_date is None:
+        current_date = datetime.now(timezone.utc)
     current_month = current_date.month
     calendar_year = current_date.year
 
@@ -114,6 +119,22 @@ def get_quarter_range_str(fiscal_quarter: int) -> str:
     return quarter_ranges.get(fiscal_quarter, "Invalid quarter")
 
 
+@functools.lru_cache(maxsize=1)
+def _build_fiscal_statement(current_date: date) -> str:
+    """Build the fiscal statement for a date (memoized; it only changes daily)."""
+    formatted_date = current_date.strftime("%Y-%m-%d UTC")  # Format as YYYY-MM-DD UTC
+    fiscal_year, fiscal_quarter = get_fiscal_period(current_date)
+    current_quarter_range = get_quarter_range_str(fiscal_quarter)
+
+    return f"""<FISCAL_CONTEXT>
+<CURRENT_DATE>{formatted_date}</CURRENT_DATE>
+<FISCAL_YEAR>{fiscal_year} (FY{fiscal_year})</FISCAL_YEAR>
+<FISCAL_QUARTER>{fiscal_quarter} (Q{fiscal_quarter})</FISCAL_QUARTER>
+<QUARTER_RANGE>{current_quarter_range}</QUARTER_RANGE>
+<FISCAL_YEAR_DEFINITION>Standard fiscal year runs from November 1st through October 31st. Note: Individual banks may have different fiscal year definitions.</FISCAL_YEAR_DEFINITION>
+</FISCAL_CONTEXT>"""
+
+
 def get_fiscal_statement() -> str:
     """
     Generate a natural language statement about the current fiscal period.
@@ -123,20 +144,7 @@ def get_fiscal_statement() -> str:
         str: Formatted fiscal statement
     """
     try:
-        current_date = datetime.now(timezone.utc)
-        formatted_date = current_date.strftime("%Y-%m-%d UTC")  # Format as YYYY-MM-DD UTC
-        fiscal_year, fiscal_quarter = get_fiscal_period()
-        current_quarter_range = get_quarter_range_str(fiscal_quarter)
-
-        statement = f"""<FISCAL_CONTEXT>
-<CURRENT_DATE>{formatted_date}</CURRENT_DATE>
-<FISCAL_YEAR>{fiscal_year} (FY{fiscal_year})</FISCAL_YEAR>
-<FISCAL_QUARTER>{fiscal_quarter} (Q{fiscal_quarter})</FISCAL_QUARTER>
-<QUARTER_RANGE>{current_quarter_range}</QUARTER_RANGE>
-<FISCAL_YEAR_DEFINITION>Standard fiscal year runs from November 1st through October 31st. Note: Individual banks may have different fiscal year definitions.</FISCAL_YEAR_DEFINITION>
-</FISCAL_CONTEXT>"""
-
-        return statement
+        return _build_fiscal_statement(datetime.now(timezone.utc).date())
     except Exception as e:
         logger.debug("Error generating fiscal statement")
         # Fallback statement in case of errors
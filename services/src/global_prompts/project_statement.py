@@ -11,10 +11,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def get_project_statement() -> str:
+def get_project_statement(include_timestamp: bool = True) -> str:
     """
     Generate the project context statement with XML-style delimiters.
 
+    Args:
+        include_timestamp: Whether to stamp the statement with the current time.
+            Pass False for prompts that must stay byte-identical between calls
+            (provider prefix caching).
+
     Returns:
         str: Formatted project statement
     """
@@ -23,7 +28,9 @@ def get_project_statement() -> str:
 
         current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
-        statement = f"""<PROJECT_CONTEXT timestamp="{current_time}">
+        timestamp_attr = f' timestamp="{current_time}"' if include_timestamp else ""
+
+        statement = f"""<PROJECT_CONTEXT{timestamp_attr}>
 This project serves financial analysts and investors by implementing an intelligent research and response system for financial market data inquiries. The system combines comprehensive financial data sources with an autonomous agent-based RAG (Retrieval-Augmented Generation) process. Users can engage in natural conversations about company performance, financial metrics, and market comparisons, and the system will independently research and generate responses as needed.
 
 <KNOWLEDGE_SOURCES>
@@ -6,6 +6,7 @@ Provides statements about output restrictions and guidelines that should
 be applied across all agent responses for compliance and quality control.
 """
 
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -131,10 +132,12 @@ Example: "The available databases do not contain data for this specific metric/t
         return "<CONFIDENCE_SIGNALING>Indicate your level of confidence in responses based on data availability and quality.</CONFIDENCE_SIGNALING>"
 
 
+@functools.lru_cache(maxsize=1)
 def get_restrictions_statement() -> str:
     """
     Generate a combined restrictions and guidelines statement for use in prompts.
-    Includes confidence signaling guidelines.
+    Includes confidence signaling guidelines. The statement is static, so it is
+    built once and memoized.
 
     Returns:
         str: Formatted restrictions statement combining compliance, quality, and confidence guidelines
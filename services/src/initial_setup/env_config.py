@@ -146,6 +146,57 @@ class Config:
         "IRIS_PROCESS_MONITOR_MODEL_NAME", "iris"
     )
 
+    # Semantic Cache Configuration (router/planner decisions)
+    SEMANTIC_CACHE_ENABLED: bool = (
+        os.getenv("IRIS_SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    )
+    SEMANTIC_CACHE_THRESHOLD: float = _safe_float_conversion(
+        os.getenv("IRIS_SEMANTIC_CACHE_THRESHOLD", "0.92"), 0.92, "SEMANTIC_CACHE_THRESHOLD"
+    )
+    SEMANTIC_CACHE_MAX_ENTRIES: int = _safe_int_conversion(os.getenv("IRIS_SEMANTIC_CACHE_MAX_ENTRIES", "512"), 512, "SEMANTIC_CACHE_MAX_ENTRIES")
+    # Router decisions are binary but depend on conversation context; match more strictly
+    ROUTER_SEMANTIC_CACHE_THRESHOLD: float = _safe_float_conversion(
+        os.getenv("IRIS_ROUTER_SEMANTIC_CACHE_THRESHOLD", "0.95"), 0.95, "ROUTER_SEMANTIC_CACHE_THRESHOLD"
+    )
+
+    # Exact-match LLM Cache Configuration (deterministic router/planner calls)
+    LLM_CACHE_ENABLED: bool = (
+        os.getenv("IRIS_LLM_CACHE_ENABLED", "true").lower() == "true"
+    )
+    LLM_CACHE_TTL_SECONDS: int = _safe_int_conversion(os.getenv("IRIS_LLM_CACHE_TTL_SECONDS", "1800"), 1800, "LLM_CACHE_TTL_SECONDS")
+    LLM_CACHE_MAX_ENTRIES: int = _safe_int_conversion(os.getenv("IRIS_LLM_CACHE_MAX_ENTRIES", "1024"), 1024, "LLM_CACHE_MAX_ENTRIES")
+    # Optional shared (L2) tier for multi-replica deployments, e.g. redis://host:6379/0
+    LLM_CACHE_REDIS_URL: str = os.getenv("IRIS_LLM_CACHE_REDIS_URL", "")
+    LLM_CACHE_REDIS_TIMEOUT: float = _safe_float_conversion(os.getenv("IRIS_LLM_CACHE_REDIS_TIMEOUT", "0.5"), 0.5, "LLM_CACHE_REDIS_TIMEOUT")
+    LLM_CACHE_LOCK_TTL_SECONDS: int = _safe_int_conversion(os.getenv("IRIS_LLM_CACHE_LOCK_TTL_SECONDS", "30"), 30, "LLM_CACHE_LOCK_TTL_SECONDS")
+
+    # Database Result Cache (opt-in: results are shared across users and sessions)
+    DB_RESULT_CACHE_ENABLED: bool = (
+        os.getenv("IRIS_DB_RESULT_CACHE_ENABLED", "false").lower() == "true"
+    )
+    DB_RESULT_CACHE_TTL_SECONDS: int = _safe_int_conversion(os.getenv("IRIS_DB_RESULT_CACHE_TTL_SECONDS", "300"), 300, "DB_RESULT_CACHE_TTL_SECONDS")
+    DB_RESULT_CACHE_MAX_ENTRIES: int = _safe_int_conversion(os.getenv("IRIS_DB_RESULT_CACHE_MAX_ENTRIES", "1024"), 1024, "DB_RESULT_CACHE_MAX_ENTRIES")
+
+    # Prefix-affinity header for load balancers in front of LLM replicas (empty disables).
+    # Carries a hash of the system prompt prefix so a consistent-hash policy can pin
+    # requests sharing a prefix to the replica that already holds its KV cache.
+    LLM_PREFIX_AFFINITY_HEADER: str = os.getenv("IRIS_LLM_PREFIX_AFFINITY_HEADER", "")
+    LLM_PREFIX_AFFINITY_CHARS: int = _safe_int_conversion(os.getenv("IRIS_LLM_PREFIX_AFFINITY_CHARS", "1024"), 1024, "LLM_PREFIX_AFFINITY_CHARS")
+
+    # Router Rule Pre-filter (skip the LLM for trivially classifiable turns)
+    ROUTER_RULES_ENABLED: bool = (
+        os.getenv("IRIS_ROUTER_RULES_ENABLED", "true").lower() == "true"
+    )
+
+    # Router Embedding Classifier (trained online from LLM routing decisions)
+    ROUTER_CLASSIFIER_ENABLED: bool = (
+        os.getenv("IRIS_ROUTER_CLASSIFIER_ENABLED", "false").lower() == "true"
+    )
+    ROUTER_CLASSIFIER_MIN_SAMPLES: int = _safe_int_conversion(os.getenv("IRIS_ROUTER_CLASSIFIER_MIN_SAMPLES", "20"), 20, "ROUTER_CLASSIFIER_MIN_SAMPLES")
+    ROUTER_CLASSIFIER_MARGIN: float = _safe_float_conversion(
+        os.getenv("IRIS_ROUTER_CLASSIFIER_MARGIN", "0.05"), 0.05, "ROUTER_CLASSIFIER_MARGIN"
+    )
+
     # S3 Configuration
     S3_BASE_PATH: str = os.getenv("S3_BASE_PATH", "")
 
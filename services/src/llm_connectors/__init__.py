@@ -4,6 +4,22 @@ LLM connectors module for AEGIS project.
 Contains connectors for language model APIs and services.
 """
 
-from .rbc_openai import call_llm, call_llm_embedding, calculate_cost
+from .rbc_openai import (
+    call_llm,
+    call_llm_embedding,
+    calculate_cost,
+    merge_usage_details,
+    retrieve_batch_results,
+    start_roundtrip_tracking,
+    submit_batch,
+)
 
-__all__ = ["call_llm", "call_llm_embedding", "calculate_cost"]
+__all__ = [
+    "call_llm",
+    "call_llm_embedding",
+    "calculate_cost",
+    "merge_usage_details",
+    "submit_batch",
+    "retrieve_batch_results",
+    "start_roundtrip_tracking",
+]
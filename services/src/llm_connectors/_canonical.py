@@ -0,0 +1,71 @@
+# services/src/llm_connectors/_canonical.py
+"""
+Canonical Request Serialization
+
+Serializes an LLM request into a canonical byte string for cache keys, so that
+requests which are equivalent to the model hash identically regardless of
+dict ordering, tool ordering or incidental whitespace in user messages.
+
+Functions:
+    canonicalize: Serializes the request components to canonical bytes
+
+Dependencies:
+    - json
+    - re
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _canonical_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the message with whitespace in user text collapsed."""
+    content = message.get("content")
+    if message.get("role") == "user" and isinstance(content, str):
+        return {**message, "content": _WHITESPACE_RE.sub(" ", content).strip()}
+    return message
+
+
+def _tool_sort_key(tool: Dict[str, Any]) -> str:
+    """Sort tools by function name."""
+    return (tool.get("function") or {}).get("name") or tool.get("name") or ""
+
+
+def canonicalize(
+    model: str,
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Any] = None,
+    template_version: Optional[str] = None,
+    context: Optional[Any] = None,
+) -> bytes:
+    """
+    Serialize the components of an LLM request to canonical bytes.
+
+    Args:
+        model (str): Model name
+        messages (list): Request messages
+        tools (list, optional): Tool definitions (order-insensitive)
+        tool_choice (Any, optional): Tool choice specification
+        template_version (str, optional): Identifier of the prompt template
+        context (Any, optional): Other inputs the request depends on
+
+    Returns:
+        bytes: Compact, key-sorted JSON encoding of the request
+    """
+    return json.dumps(
+        {
+            "m": model,
+            "msgs": [_canonical_message(message) for message in messages],
+            "tools": sorted(tools, key=_tool_sort_key) if tools else tools,
+            "tc": tool_choice,
+            "tv": template_version,
+            "ctx": context,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
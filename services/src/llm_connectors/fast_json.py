@@ -0,0 +1,42 @@
+# services/src/llm_connectors/fast_json.py
+"""
+Fast JSON Module
+
+Parses JSON returned by the LLM (tool call arguments) with orjson when it is
+installed, falling back to the standard library otherwise. orjson's
+JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+json.JSONDecodeError either way.
+
+Functions:
+    loads: Parses a JSON document from str or bytes
+
+Dependencies:
+    - json
+    - orjson (optional)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, use the standard library json
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data (Union[str, bytes]): JSON text
+
+    Returns:
+        Any: The parsed document
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,291 @@
+# services/src/llm_connectors/llm_cache.py
+"""
+LLM Response Cache Module
+
+This module provides an exact-match cache for deterministic (temperature 0)
+tool-calling agents. Agents compute a deterministic key from the request and
+store their parsed, validated tool arguments so that identical requests skip
+the LLM call, the JSON parse and the validation step entirely.
+
+When IRIS_LLM_CACHE_REDIS_URL is set, an in-process LRU (L1) is layered over
+a shared Redis cache (L2) so that replicas behind a load balancer share hits.
+Concurrent identical misses are coalesced (singleflight): the first caller
+calls the LLM and the others wait for its result, in-process via an event and
+across replicas via a short-lived Redis lock.
+
+Classes:
+    LLMCache: Thread-safe LRU cache with per-entry TTL and optional Redis tier
+
+Functions:
+    make_cache_key: Builds a BLAKE2b key from the canonical request
+
+Dependencies:
+    - hashlib
+    - json
+    - threading
+    - time
+    - redis (optional, for the shared L2 tier)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..initial_setup.env_config import config
+from ._canonical import canonicalize
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+# Redis key prefixes for cached values and fill locks
+_REDIS_VALUE_PREFIX = "aegis:llm_cache:"
+_REDIS_LOCK_PREFIX = "aegis:llm_cache_lock:"
+
+# Poll interval while waiting for another replica to fill a key
+_LOCK_POLL_SECONDS = 0.05
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Any] = None,
+    template_version: Optional[str] = None,
+    context: Optional[Any] = None,
+) -> str:
+    """
+    Build a deterministic cache key for an LLM request.
+
+    The request is canonicalized first (sorted keys and tools, collapsed
+    whitespace in user messages) so that equivalent requests share a key.
+
+    The system prompt is represented by `template_version` rather than its
+    rendered text, since the rendered prompt carries timestamps that change
+    on every call.
+
+    Args:
+        model (str): Model name
+        messages (list): Request messages (excluding the system prompt)
+        tools (list, optional): Tool definitions
+        tool_choice (Any, optional): Tool choice specification
+        template_version (str, optional): Identifier of the prompt template
+        context (Any, optional): Other inputs the rendered system prompt depends on
+
+    Returns:
+        str: Hex BLAKE2b digest of the canonical request
+    """
+    payload = canonicalize(model, messages, tools, tool_choice, template_version, context)
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+class LLMCache:
+    """
+    In-process LRU cache with a per-entry time-to-live.
+
+    Values should be the parsed result of an LLM call (not the raw response)
+    so that cache hits also skip response parsing and validation. When a
+    Redis client is provided, values must be JSON-serializable; Redis errors
+    are logged and the cache falls back to the in-process tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 1800,
+        redis_client: Optional[Any] = None,
+        lock_ttl_seconds: float = 30,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.lock_ttl_seconds = lock_ttl_seconds
+        self._redis = redis_client
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Tuple[threading.Event, int]] = {}
+        self._lock = threading.Lock()
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        """Return the L1 value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        """Store a value in L1, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_shared(self, key: str) -> Optional[Any]:
+        """Return the L2 value for a key, promoting it to L1 on a hit."""
+        try:
+            raw = self._redis.get(_REDIS_VALUE_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e))
+            return None
+        if raw is None:
+            return None
+        value = json.loads(raw)
+        self._set_local(key, value)
+        return value
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key (str): Cache key from make_cache_key
+
+        Returns:
+            Optional[Any]: Cached value or None
+        """
+        value = self._get_local(key)
+        if value is None and self._redis is not None:
+            value = self._get_shared(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value under a key, evicting the least recently used entry when full.
+
+        Also releases the fill lock taken by claim() and wakes any waiters.
+
+        Args:
+            key (str): Cache key from make_cache_key
+            value (Any): Parsed result to cache
+        """
+        self._set_local(key, value)
+        if self._redis is not None:
+            try:
+                pipeline = self._redis.pipeline()
+                pipeline.set(
+                    _REDIS_VALUE_PREFIX + key, json.dumps(value), ex=int(self.ttl_seconds)
+                )
+                pipeline.delete(_REDIS_LOCK_PREFIX + key)
+                pipeline.execute()
+            except Exception as e:
+                logger.warning("Redis cache write failed: %s", str(e))
+        self._finish_flight(key)
+
+    def claim(self, key: str) -> Optional[Any]:
+        """
+        Claim the right to fill a missed key, or wait for another caller to fill it.
+
+        Identical concurrent requests are coalesced: the first caller in this
+        process proceeds to call the LLM and the rest wait for its result.
+        With Redis, the first caller also takes a short-lived lock (SET NX) so
+        that callers on other replicas poll for the value instead.
+
+        Args:
+            key (str): Cache key from make_cache_key
+
+        Returns:
+            Optional[Any]: Value filled by another caller, or None if the caller
+                should compute the value itself and then call set() or release()
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is None:
+                self._inflight[key] = (threading.Event(), threading.get_ident())
+
+        if flight is not None:
+            flight[0].wait(self.lock_ttl_seconds)
+            return self._get_local(key)
+
+        if self._redis is None:
+            return None
+        lock_key = _REDIS_LOCK_PREFIX + key
+        try:
+            if self._redis.set(lock_key, "1", nx=True, ex=int(self.lock_ttl_seconds)):
+                return None
+            deadline = time.monotonic() + self.lock_ttl_seconds
+            while time.monotonic() < deadline:
+                time.sleep(_LOCK_POLL_SECONDS)
+                value = self._get_shared(key)
+                if value is not None:
+                    self._finish_flight(key)
+                    return value
+                if not self._redis.exists(lock_key):
+                    return None
+        except Exception as e:
+            logger.warning("Redis cache lock failed: %s", str(e))
+        return None
+
+    def release(self, key: str) -> None:
+        """
+        Release a claim taken by the current thread without storing a value.
+
+        Waiters are woken and compute the value themselves. Calls from threads
+        that do not hold the claim are ignored.
+
+        Args:
+            key (str): Cache key from make_cache_key
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is None or flight[1] != threading.get_ident():
+                return
+        if self._redis is not None:
+            try:
+                self._redis.delete(_REDIS_LOCK_PREFIX + key)
+            except Exception as e:
+                logger.warning("Redis cache unlock failed: %s", str(e))
+        self._finish_flight(key)
+
+    def _finish_flight(self, key: str) -> None:
+        """Remove the in-flight marker for a key and wake its waiters."""
+        with self._lock:
+            flight = self._inflight.pop(key, None)
+        if flight is not None:
+            flight[0].set()
+
+    def clear(self) -> None:
+        """Remove all in-process entries (the shared tier expires by TTL)."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _create_redis_client() -> Optional[Any]:
+    """
+    Create the Redis client for the shared cache tier, if configured.
+
+    Returns:
+        Optional[Any]: Redis client, or None if not configured or unavailable
+    """
+    if not config.LLM_CACHE_REDIS_URL:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("IRIS_LLM_CACHE_REDIS_URL is set but redis is not installed")
+        return None
+    return redis.Redis.from_url(
+        config.LLM_CACHE_REDIS_URL, socket_timeout=config.LLM_CACHE_REDIS_TIMEOUT
+    )
+
+
+def create_llm_cache() -> LLMCache:
+    """
+    Create an LLMCache sized from the environment configuration.
+
+    Returns:
+        LLMCache: New cache instance
+    """
+    return LLMCache(
+        max_entries=config.LLM_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+        redis_client=_create_redis_client(),
+        lock_ttl_seconds=config.LLM_CACHE_LOCK_TTL_SECONDS,
+    )
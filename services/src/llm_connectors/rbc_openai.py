@@ -7,9 +7,13 @@ chat completions and embeddings. It works in both RBC and local environments
 with comprehensive error handling, retry logic, and cost tracking.
 
 Functions:
+    start_roundtrip_tracking: Starts counting LLM round-trips for the current request
     calculate_cost: Calculates token usage costs using Decimal precision
+    merge_usage_details: Combines the usage details of several calls
     call_llm: Makes chat completion calls (streaming and non-streaming)
     call_llm_embedding: Makes embedding calls
+    submit_batch: Submits chat completion requests to the Batch API
+    retrieve_batch_results: Retrieves the status and results of a batch
 
 Examples:
     # Chat completion
@@ -46,15 +50,22 @@ Examples:
 
 Dependencies:
     - openai
+    - contextvars
+    - hashlib
     - logging
     - time
     - decimal
 """
 
+import contextvars
+import hashlib
+import io
+import json
 import logging
+import threading
 import time
 from decimal import Decimal
-from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from openai import (
     OpenAI,
@@ -82,6 +93,50 @@ def _get_base_url():
 logger = logging.getLogger(__name__)
 
 
+# LLM round-trip counts by call type for the current request. The dict is shared
+# with worker threads started via contextvars.copy_context(), hence the lock.
+_ROUNDTRIPS: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar(
+    "llm_roundtrips", default=None
+)
+_ROUNDTRIPS_LOCK = threading.Lock()
+
+
+def start_roundtrip_tracking() -> Dict[str, int]:
+    """
+    Start counting LLM round-trips (API attempts) in the current context.
+
+    Returns:
+        dict: Live counts by call type ('chat', 'embedding'), updated by later calls
+    """
+    counts: Dict[str, int] = {}
+    _ROUNDTRIPS.set(counts)
+    return counts
+
+
+def _record_roundtrip(call_type: str) -> None:
+    """Count one API attempt if round-trip tracking is active."""
+    counts = _ROUNDTRIPS.get()
+    if counts is not None:
+        with _ROUNDTRIPS_LOCK:
+            counts[call_type] = counts.get(call_type, 0) + 1
+
+
+def _prefix_affinity_key(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Hash the leading system prompt so replicas can be chosen by shared prefix.
+
+    Args:
+        messages (list): Chat messages for the call
+
+    Returns:
+        Optional[str]: Short hex digest, or None without a leading system message
+    """
+    if not messages or messages[0].get("role") != "system":
+        return None
+    prefix = (messages[0].get("content") or "")[: config.LLM_PREFIX_AFFINITY_CHARS]
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+
 class OpenAIConnectorError(Exception):
     """Base exception class for OpenAI connector errors."""
 
@@ -116,6 +171,44 @@ def calculate_cost(
     return float(total_cost)
 
 
+def merge_usage_details(
+    *usage_details: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Combine the usage details of several calls made for one stage.
+
+    Token counts, cost and response time are summed; the model names of the
+    individual calls are joined. Missing (None) usage details are skipped.
+
+    Args:
+        *usage_details (Optional[Dict[str, Any]]): Usage details as returned
+            by call_llm / call_llm_embedding
+
+    Returns:
+        Optional[Dict[str, Any]]: The combined usage details, or None if no
+            call reported usage
+    """
+    present = [usage for usage in usage_details if usage]
+    if not present:
+        return None
+    if len(present) == 1:
+        return present[0]
+
+    models = []
+    for usage in present:
+        model = usage.get("model")
+        if model and model not in models:
+            models.append(model)
+    cost = sum(Decimal(str(usage.get("cost", 0.0))) for usage in present)
+    return {
+        "model": ", ".join(models),
+        "prompt_tokens": sum(usage.get("prompt_tokens", 0) for usage in present),
+        "completion_tokens": sum(usage.get("completion_tokens", 0) for usage in present),
+        "cost": float(cost),
+        "response_time_ms": sum(usage.get("response_time_ms", 0) for usage in present),
+    }
+
+
 def call_llm(
     oauth_token: str,
     prompt_token_cost: float = 0,
@@ -179,6 +272,15 @@ def call_llm(
     if "timeout" not in params:
         params["timeout"] = REQUEST_TIMEOUT
 
+    # Pin requests sharing a system prompt prefix to the same replica (KV-cache reuse)
+    if config.LLM_PREFIX_AFFINITY_HEADER:
+        affinity_key = _prefix_affinity_key(messages)
+        if affinity_key:
+            params["extra_headers"] = {
+                **(params.get("extra_headers") or {}),
+                config.LLM_PREFIX_AFFINITY_HEADER: affinity_key,
+            }
+
     # Handle streaming option
     is_streaming = params.get("stream", False)
     if is_streaming:
@@ -194,6 +296,7 @@ def call_llm(
 
         try:
             # Make the chat completion API call
+            _record_roundtrip("chat")
             api_response = client.chat.completions.create(**params)
             attempt_response_time_ms = int((time.time() - attempt_start_time) * 1000)
 
@@ -335,6 +438,7 @@ def call_llm_embedding(
 
         try:
             # Make the embedding API call
+            _record_roundtrip("embedding")
             api_response = client.embeddings.create(**embedding_params)
             attempt_response_time_ms = int((time.time() - attempt_start_time) * 1000)
 
@@ -396,6 +500,117 @@ def call_llm_embedding(
     )
 
 
+def submit_batch(
+    oauth_token: str,
+    requests: List[Dict[str, Any]],
+    endpoint: str = "/v1/chat/completions",
+    completion_window: str = "24h",
+) -> str:
+    """
+    Submits requests to the OpenAI Batch API for asynchronous processing.
+
+    Batch requests are billed at a discount and are intended for
+    non-interactive workloads; results are collected later with
+    retrieve_batch_results.
+
+    Args:
+        oauth_token (str): OAuth token (RBC) or API key (local)
+        requests (list): Batch request lines, each with 'custom_id', 'method',
+            'url' and 'body' keys
+        endpoint (str): API endpoint the requests target
+        completion_window (str): Time window for the batch to complete
+
+    Returns:
+        str: The batch ID
+
+    Raises:
+        OpenAIConnectorError: If the upload or batch creation fails
+        ValueError: If no requests are provided
+    """
+    if not requests:
+        raise ValueError("At least one batch request is required")
+
+    client = OpenAI(api_key=oauth_token, base_url=_get_base_url())
+    payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+
+    logger.info("Submitting batch of %d requests to %s", len(requests), endpoint)
+
+    try:
+        batch_file = client.files.create(
+            file=("batch_requests.jsonl", io.BytesIO(payload)),
+            purpose="batch",
+            timeout=REQUEST_TIMEOUT,
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=endpoint,
+            completion_window=completion_window,
+            timeout=REQUEST_TIMEOUT,
+        )
+    except OpenAIError as e:
+        logger.error("Failed to submit batch: %s", str(e))
+        raise OpenAIConnectorError(f"Failed to submit batch: {str(e)}") from e
+
+    return batch.id
+
+
+def retrieve_batch_results(
+    oauth_token: str, batch_id: str
+) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Retrieves the status of a batch and, once completed, its result lines.
+
+    A completed batch may have an output file, an error file or both (a batch
+    in which every request failed only has an error file). Lines from both are
+    returned; error file lines are also logged.
+
+    Args:
+        oauth_token (str): OAuth token (RBC) or API key (local)
+        batch_id (str): The batch ID returned by submit_batch
+
+    Returns:
+        Tuple[str, Optional[List[Dict]]]:
+            - Batch status (e.g. 'in_progress', 'completed', 'failed')
+            - Parsed result lines when completed (possibly empty), otherwise None
+
+    Raises:
+        OpenAIConnectorError: If the batch or its output cannot be retrieved
+    """
+    client = OpenAI(api_key=oauth_token, base_url=_get_base_url())
+
+    try:
+        batch = client.batches.retrieve(batch_id, timeout=REQUEST_TIMEOUT)
+        if batch.status != "completed":
+            return batch.status, None
+
+        output_text = ""
+        if batch.output_file_id:
+            output_text = client.files.content(
+                batch.output_file_id, timeout=REQUEST_TIMEOUT
+            ).text
+        error_text = ""
+        if batch.error_file_id:
+            error_text = client.files.content(
+                batch.error_file_id, timeout=REQUEST_TIMEOUT
+            ).text
+    except OpenAIError as e:
+        logger.error("Failed to retrieve batch %s: %s", batch_id, str(e))
+        raise OpenAIConnectorError(f"Failed to retrieve batch: {str(e)}") from e
+
+    results = [json.loads(line) for line in output_text.splitlines() if line.strip()]
+    errors = [json.loads(line) for line in error_text.splitlines() if line.strip()]
+    if errors:
+        logger.warning("Batch %s completed with %d failed requests", batch_id, len(errors))
+        for error in errors:
+            logger.warning(
+                "Batch %s request %s failed: %s",
+                batch_id,
+                error.get("custom_id"),
+                error.get("error") or (error.get("response") or {}).get("body"),
+            )
+    return batch.status, results + errors
+
+
 def _stream_wrapper(
     stream_iterator: Iterator,
     model_name: str,
@@ -0,0 +1,147 @@
+# services/src/llm_connectors/semantic_cache.py
+"""
+Semantic Cache Module
+
+This module provides a small in-process semantic cache for agent decisions.
+Entries are keyed on an embedding of the request text; a lookup returns the
+stored value of the most similar prior request when its cosine similarity is
+at or above the configured threshold, letting agents skip an LLM round-trip
+for near-duplicate requests.
+
+Classes:
+    SemanticCache: Thread-safe, bounded cosine-similarity cache
+
+Functions:
+    embed_text: Embeds a text string using the configured embedding model
+
+Dependencies:
+    - logging
+    - math
+    - threading
+    - OpenAI connector for embedding calls
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ..initial_setup.env_config import config
+from .rbc_openai import call_llm_embedding
+
+# Get module logger
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: List[float]) -> Tuple[float, ...]:
+    """Return the vector scaled to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return tuple(vector)
+    return tuple(v / norm for v in vector)
+
+
+class SemanticCache:
+    """
+    Bounded cosine-similarity cache.
+
+    Entries are grouped by namespace so that values are only reused between
+    requests that share the same context (e.g. the same set of available
+    databases). Each namespace holds at most `max_entries` items and evicts
+    the least recently used entry when full.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 512):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, "OrderedDict[int, Tuple[Tuple[float, ...], Any]]"] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, embedding: List[float], namespace: Hashable = None) -> Optional[Any]:
+        """
+        Find the cached value for the most similar stored embedding.
+
+        Args:
+            embedding (List[float]): Embedding of the incoming request
+            namespace (Hashable, optional): Context the entry must share
+
+        Returns:
+            Optional[Any]: Cached value when similarity >= threshold, otherwise None
+        """
+        query = _normalize(embedding)
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if not entries:
+                return None
+
+            best_id, best_score = None, -1.0
+            for entry_id, (stored, _) in entries.items():
+                score = sum(a * b for a, b in zip(query, stored))
+                if score > best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None or best_score < self.threshold:
+                return None
+
+            entries.move_to_end(best_id)
+            logger.debug("Semantic cache hit with similarity %.3f", best_score)
+            return entries[best_id][1]
+
+    def add(self, embedding: List[float], value: Any, namespace: Hashable = None) -> None:
+        """
+        Store a value against an embedding.
+
+        Args:
+            embedding (List[float]): Embedding of the request that produced the value
+            value (Any): Value to return for similar future requests
+            namespace (Hashable, optional): Context the entry belongs to
+        """
+        stored = _normalize(embedding)
+        with self._lock:
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[self._next_id] = (stored, value)
+            self._next_id += 1
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def embed_text(
+    text: str, token: Optional[str]
+) -> Tuple[Optional[List[float]], Optional[Dict[str, Any]]]:
+    """
+    Embed a text string for semantic cache lookups.
+
+    Errors are logged and swallowed so that a failed embedding only disables
+    the cache for the current request.
+
+    Args:
+        text (str): Text to embed
+        token (str): Authentication token for API access
+
+    Returns:
+        Tuple[Optional[List[float]], Optional[Dict[str, Any]]]:
+            - Embedding vector, or None if the call failed
+            - Usage details dictionary for the embedding call, or None
+    """
+    try:
+        model_config = config.get_model_config("embedding")
+        response, usage_details = call_llm_embedding(
+            oauth_token=token,
+            model=model_config["name"],
+            input=text,
+            prompt_token_cost=model_config["prompt_token_cost"],
+        )
+        if response and response.data and response.data[0].embedding:
+            return response.data[0].embedding, usage_details
+        logger.warning("No embedding data returned for semantic cache lookup")
+        return None, usage_details
+    except Exception:
+        logger.warning("Semantic cache embedding failed; skipping cache")
+        return None, None